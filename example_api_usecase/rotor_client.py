@@ -1003,10 +1003,13 @@ class RotorApiClient:
                     "routeName": event_data.get("routeName"),
                 }
             elif event_type == "route_execution_progress" and isinstance(event_data, Mapping):
-                self._latest_route_progress = deepcopy(dict(event_data))
-                if self._current_route_execution is None:
-                    self._current_route_execution = {"executing": True}
-                self._current_route_execution["executing"] = True
+                self._apply_route_progress_event(event_data)
+            elif event_type == "route_execution_progress_batch" and isinstance(event_data, Mapping):
+                events = event_data.get("events")
+                if isinstance(events, list):
+                    for progress_data in events:
+                        if isinstance(progress_data, Mapping):
+                            self._apply_route_progress_event(progress_data)
             elif event_type == "route_execution_stopped":
                 self._mark_route_idle()
             elif event_type == "route_execution_completed" and isinstance(event_data, Mapping):
@@ -1016,6 +1019,12 @@ class RotorApiClient:
                     self._current_route_execution["success"] = event_data.get("success")
                     self._current_route_execution["error"] = event_data.get("error")
 
+    def _apply_route_progress_event(self, event_data: Mapping[str, Any]) -> None:
+        self._latest_route_progress = deepcopy(dict(event_data))
+        if self._current_route_execution is None:
+            self._current_route_execution = {"executing": True}
+        self._current_route_execution["executing"] = True
+
     def _apply_connection_event(self, event_data: Mapping[str, Any]) -> None:
         connected = bool(event_data.get("connected"))
         connection_update = {
@@ -1,7 +1,8 @@
 """Allow running the server package directly with python -m server."""
 
+import sys
+
 from server.main import main
 
 if __name__ == "__main__":
-    main()
-
+    sys.exit(main())
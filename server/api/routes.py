@@ -259,7 +259,7 @@ def handle_get_settings(handler: BaseHTTPRequestHandler, state: "ServerState") -
         handler: The HTTP request handler instance.
         state: The server state singleton.
     """
-    send_json(handler, state.settings.get_all())
+    send_json(handler, dict(state.settings.get_all()))
 
 
 def handle_post_settings(handler: BaseHTTPRequestHandler, state: "ServerState") -> None:
@@ -273,16 +273,17 @@ def handle_post_settings(handler: BaseHTTPRequestHandler, state: "ServerState")
     if payload is None:
         return
     state.settings.update(payload)
+    settings = dict(state.settings.get_all())
     
     # Update RotorLogic config too
     if state.rotor_logic:
-        state.rotor_logic.update_config(state.settings.get_all())
+        state.rotor_logic.update_config(settings)
     
     # Broadcast settings update to all clients
     if state.websocket_manager:
-        state.websocket_manager.broadcast_settings_updated(state.settings.get_all())
+        state.websocket_manager.broadcast_settings_updated(settings)
     
-    send_json(handler, {"status": "ok", "settings": state.settings.get_all()})
+    send_json(handler, {"status": "ok", "settings": settings})
 
 
 # --- Port Routes ---
@@ -307,28 +308,35 @@ def handle_get_status(handler: BaseHTTPRequestHandler, state: "ServerState") ->
         handler: The HTTP request handler instance.
         state: The server state singleton.
     """
+    # Get client count from session manager (has its own lock)
+    client_count = 0
+    if state.session_manager:
+        client_count = state.session_manager.get_session_count()
+
+    # Only snapshot the connection under the rotor lock; writing the
+    # response to a slow client must not block serial commands.
     with state.rotor_lock:
-        # Get client count from session manager
-        client_count = 0
-        if state.session_manager:
-            client_count = state.session_manager.get_session_count()
-            
-        if state.rotor_connection and state.rotor_connection.is_connected():
+        connection = state.rotor_connection
+        if connection and connection.is_connected():
             # Get raw status from connection
-            status = state.rotor_connection.get_status()
-            
-            config = state.settings.get_all()
-            status_payload = _build_status_payload(status, config)
-
-            send_json(handler, {
-                "connected": True,
-                "port": state.rotor_connection.port,
-                "baudRate": state.rotor_connection.baud_rate,
-                "status": status_payload,
-                "clientCount": client_count
-            })
+            status = connection.get_status()
+            port = connection.port
+            baud_rate = connection.baud_rate
         else:
-            send_json(handler, {"connected": False, "clientCount": client_count})
+            connection = None
+
+    if connection is None:
+        send_json(handler, {"connected": False, "clientCount": client_count})
+        return
+
+    config = state.settings.get_all()
+    send_json(handler, {
+        "connected": True,
+        "port": port,
+        "baudRate": baud_rate,
+        "status": _build_status_payload(status, config),
+        "clientCount": client_count
+    })
 
 
 # --- Connection Routes ---
@@ -748,41 +756,48 @@ def handle_get_position(handler: BaseHTTPRequestHandler, state: "ServerState") -
         cone_angle = 10.0
         cone_length = 1000.0
     
+    client_count = 0
+    if state.session_manager:
+        client_count = state.session_manager.get_session_count()
+
     with state.rotor_lock:
-        client_count = 0
-        if state.session_manager:
-            client_count = state.session_manager.get_session_count()
-            
-        if state.rotor_connection and state.rotor_connection.is_connected():
-            status = state.rotor_connection.get_status()
-            
-            config = state.settings.get_all()
-            status_payload = _build_status_payload(status, config)
-            
-            # Build calibration info
-            calibration = {
-                "azimuthOffset": config.get("azimuthOffset", 0.0),
-                "elevationOffset": config.get("elevationOffset", 0.0),
-                "azimuthScaleFactor": config.get("azimuthScaleFactor", 1.0),
-                "elevationScaleFactor": config.get("elevationScaleFactor", 1.0)
-            }
-
-            send_json(handler, {
-                "connected": True,
-                "port": state.rotor_connection.port,
-                "baudRate": state.rotor_connection.baud_rate,
-                "position": {
-                    **status_payload,
-                    "calibration": calibration
-                },
-                "cone": {
-                    "angle": cone_angle,
-                    "length": cone_length
-                },
-                "clientCount": client_count
-            })
+        connection = state.rotor_connection
+        if connection and connection.is_connected():
+            status = connection.get_status()
+            port = connection.port
+            baud_rate = connection.baud_rate
         else:
-            send_json(handler, {"connected": False, "clientCount": client_count})
+            connection = None
+
+    if connection is None:
+        send_json(handler, {"connected": False, "clientCount": client_count})
+        return
+
+    config = state.settings.get_all()
+    status_payload = _build_status_payload(status, config)
+
+    # Build calibration info
+    calibration = {
+        "azimuthOffset": config.get("azimuthOffset", 0.0),
+        "elevationOffset": config.get("elevationOffset", 0.0),
+        "azimuthScaleFactor": config.get("azimuthScaleFactor", 1.0),
+        "elevationScaleFactor": config.get("elevationScaleFactor", 1.0)
+    }
+
+    send_json(handler, {
+        "connected": True,
+        "port": port,
+        "baudRate": baud_rate,
+        "position": {
+            **status_payload,
+            "calibration": calibration
+        },
+        "cone": {
+            "angle": cone_angle,
+            "length": cone_length
+        },
+        "clientCount": client_count
+    })
 
 
 # --- Client Management Routes ---
@@ -1001,7 +1016,7 @@ def handle_post_server_settings(handler: BaseHTTPRequestHandler, state: "ServerS
     
     # Broadcast settings update to all clients
     if state.websocket_manager:
-        state.websocket_manager.broadcast_settings_updated(state.settings.get_all())
+        state.websocket_manager.broadcast_settings_updated(dict(state.settings.get_all()))
     
     send_json(handler, {
         "status": "ok",
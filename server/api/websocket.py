@@ -12,7 +12,7 @@ import json
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 try:
     import websockets
@@ -26,6 +26,7 @@ from server.utils.logging import log
 
 if TYPE_CHECKING:
     from server.core.session_manager import SessionManager
+    from server.core.state import ServerState
 
 
 @dataclass
@@ -49,6 +50,7 @@ class WebSocketManager:
         """Initialize the WebSocket manager."""
         self.clients: Dict[WebSocketServerProtocol, WebSocketClient] = {}
         self.session_manager: Optional["SessionManager"] = None
+        self.server_state: Optional["ServerState"] = None
         self._lock = threading.Lock()
         self._server: Optional[Any] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -62,6 +64,14 @@ class WebSocketManager:
             session_manager: The session manager instance.
         """
         self.session_manager = session_manager
+
+    def set_server_state(self, state: "ServerState") -> None:
+        """Set the owning server state reference.
+        
+        Args:
+            state: The ServerState instance.
+        """
+        self.server_state = state
         
     async def _handle_client(self, websocket: WebSocketServerProtocol) -> None:
         """Handle a new WebSocket client connection.
@@ -114,10 +124,11 @@ class WebSocketManager:
         Args:
             websocket: The WebSocket connection.
         """
-        # Import here to avoid circular imports
-        from server.core.state import ServerState
-        
-        state = ServerState.get_instance()
+        state = self.server_state
+        if state is None:
+            # Import here to avoid circular imports
+            from server.core.state import ServerState
+            state = ServerState.get_instance()
         
         # Send connection state
         connection_data = {
@@ -280,6 +291,20 @@ class WebSocketManager:
         }
         self._schedule_broadcast(json.dumps(message))
     
+    def broadcast_route_execution_progress_batch(self, events: List[Dict[str, Any]]) -> None:
+        """Broadcast several route execution progress updates in one message.
+        
+        Args:
+            events: Progress data dictionaries in emission order.
+        """
+        message = {
+            "type": "route_execution_progress_batch",
+            "data": {
+                "events": events
+            }
+        }
+        self._schedule_broadcast(json.dumps(message))
+    
     def broadcast_route_execution_stopped(self) -> None:
         """Broadcast that route execution was stopped."""
         message = {
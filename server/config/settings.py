@@ -4,15 +4,17 @@ Handles loading/saving configuration from a single JSON file.
 All settings are stored in web-settings.json for consistency across devices.
 """
 
-import json
+import math
 import re
 import threading
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 # Matches valid integer or decimal numbers (optional leading minus sign)
 _NUMERIC_RE = re.compile(r'^-?\d+(\.\d+)?$')
 
+from server.utils.json_io import dump_json, load_json_file
 from server.utils.logging import log
 from server.config.defaults import DEFAULT_CONFIG
 
@@ -34,34 +36,39 @@ class SettingsManager:
         self.config_dir = Path(config_dir)
         self.json_file = self.config_dir / "web-settings.json"
         self.lock = threading.Lock()
-        self.cache: Dict[str, Any] = {}
+        # Read-only snapshot, rebound as a whole on every change so readers
+        # never need the lock.
+        self._snapshot: Mapping[str, Any] = MappingProxyType({})
         self._load()
 
     def _load(self) -> None:
-        """Load all settings into cache."""
+        """Load all settings into a fresh snapshot."""
         with self.lock:
             # Start with defaults
-            self.cache = DEFAULT_CONFIG.copy()
+            config = DEFAULT_CONFIG.copy()
             
             # Load JSON (User Settings)
             if self.json_file.exists():
                 try:
-                    with open(self.json_file, 'r', encoding='utf-8') as f:
-                        json_config = json.load(f)
+                    json_config = load_json_file(self.json_file)
+                    if not isinstance(json_config, dict):
+                        raise ValueError("settings file must contain a JSON object")
                     
                     # Filter out invalid/corrupted values and lowercase duplicates
                     cleaned_config = self._clean_config(json_config)
-                    self.cache.update(cleaned_config)
-                    self.cache.update(self._sanitize_overlay_settings(self.cache))
-                    self.cache.update(self._sanitize_limit_settings(self.cache))
+                    config.update(cleaned_config)
+                    config.update(self._sanitize_overlay_settings(config))
+                    config.update(self._sanitize_limit_settings(config))
                     log(f"[Settings] Loaded settings from {self.json_file}")
-                except Exception as e:
+                except (OSError, ValueError, TypeError, OverflowError, RecursionError) as e:
                     log(f"[Settings] Error loading JSON: {e}")
             else:
                 # Create initial JSON file with defaults
-                self._save_to_file()
+                self._save_to_file(config)
                 log(f"[Settings] Created default settings file: {self.json_file}")
 
+            self._snapshot = MappingProxyType(config)
+
     def _clean_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Clean configuration by removing invalid entries.
         
@@ -83,29 +90,33 @@ class SettingsManager:
 
             # Fix string values that should be other types
             if isinstance(value, str):
-                # Handle "true ; alternatives..." format from old INI
-                if value.startswith('true') or value.startswith('false'):
-                    cleaned[key] = value.lower().startswith('true')
-                elif value.startswith('null'):
-                    cleaned[key] = None
-                else:
-                    # Try to parse as number – only if the first token looks numeric
-                    try:
-                        stripped = value.split()[0] if value.split() else ''
-                        if stripped and _NUMERIC_RE.match(stripped):
-                            if '.' in stripped:
-                                cleaned[key] = float(stripped)
-                            else:
-                                cleaned[key] = int(stripped)
-                        else:
-                            cleaned[key] = value
-                    except (ValueError, IndexError):
-                        cleaned[key] = value
+                cleaned[key] = self._parse_legacy_string(value)
             else:
                 cleaned[key] = value
         
         return cleaned
 
+    def _parse_legacy_string(self, value: str) -> Any:
+        """Convert a string left over from the old INI format to its typed value.
+        
+        Args:
+            value: The raw string value, e.g. "true ; alternatives..." or "45 ; deg".
+            
+        Returns:
+            A bool, None, int or float when the leading token has that meaning,
+            otherwise the unchanged string.
+        """
+        if value.startswith(('true', 'false')):
+            return value.startswith('true')
+        if value.startswith('null'):
+            return None
+
+        # Parse as number only if the first token looks numeric
+        tokens = value.split()
+        if tokens and _NUMERIC_RE.match(tokens[0]):
+            return float(tokens[0]) if '.' in tokens[0] else int(tokens[0])
+        return value
+
     def _coerce_bool(self, value: Any, fallback: bool) -> bool:
         """Coerce a value to boolean with support for string values."""
         if isinstance(value, bool):
@@ -169,13 +180,15 @@ class SettingsManager:
         }
 
     def _coerce_number(self, value: Any, fallback: float) -> float:
-        """Coerce a config value to float with fallback."""
+        """Coerce a config value to a finite float with fallback."""
         if isinstance(value, bool):
             return fallback
         try:
-            return float(value)
-        except (TypeError, ValueError):
+            number = float(value)
+        except (TypeError, ValueError, OverflowError):
             return fallback
+        # inf/nan would break the int() conversions and limit clamping
+        return number if math.isfinite(number) else fallback
 
     def _sanitize_limit_settings(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize soft-limit settings to numeric hardware-safe ranges."""
@@ -225,22 +238,26 @@ class SettingsManager:
             "elevationMaxLimit": el_max,
         }
 
-    def _save_to_file(self) -> None:
-        """Save current cache to JSON file."""
+    def _save_to_file(self, config: Dict[str, Any]) -> None:
+        """Save the given settings to the JSON file.
+        
+        Args:
+            config: The complete settings dictionary to write.
+        """
         try:
-            with open(self.json_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2)
+            with open(self.json_file, 'wb') as f:
+                dump_json(config, f)
         except Exception as e:
             log(f"[Settings] Error saving JSON: {e}")
 
-    def get_all(self) -> Dict[str, Any]:
-        """Get all settings as a dictionary.
+    def get_all(self) -> Mapping[str, Any]:
+        """Get all settings as a read-only mapping.
         
         Returns:
-            A copy of all current settings.
+            A snapshot of all current settings. It is not updated by later
+            changes; callers that need a mutable dict must copy it.
         """
-        with self.lock:
-            return self.cache.copy()
+        return self._snapshot
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a specific setting value.
@@ -252,8 +269,7 @@ class SettingsManager:
         Returns:
             The setting value or default.
         """
-        with self.lock:
-            return self.cache.get(key, default)
+        return self._snapshot.get(key, default)
 
     def update(self, new_settings: Dict[str, Any]) -> None:
         """Update settings and save to JSON.
@@ -263,10 +279,12 @@ class SettingsManager:
         """
         with self.lock:
             cleaned_settings = self._clean_config(new_settings or {})
-            self.cache.update(cleaned_settings)
-            self.cache.update(self._sanitize_overlay_settings(self.cache))
-            self.cache.update(self._sanitize_limit_settings(self.cache))
-            self._save_to_file()
+            config = dict(self._snapshot)
+            config.update(cleaned_settings)
+            config.update(self._sanitize_overlay_settings(config))
+            config.update(self._sanitize_limit_settings(config))
+            self._snapshot = MappingProxyType(config)
+            self._save_to_file(config)
 
     def reload(self) -> None:
         """Reload settings from files."""
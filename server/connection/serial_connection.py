@@ -9,7 +9,7 @@ from __future__ import annotations
 import re
 import time
 import threading
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from server.utils.logging import log
 from server.connection.port_scanner import SERIAL_AVAILABLE
@@ -18,6 +18,10 @@ from server.connection.port_scanner import SERIAL_AVAILABLE
 if SERIAL_AVAILABLE:
     import serial
 
+# Status line fields, e.g. "AZ=123 EL=045"
+_AZ_RE = re.compile(r'AZ\s*=\s*([^\s]+)', re.IGNORECASE)
+_EL_RE = re.compile(r'EL\s*=\s*([^\s]+)', re.IGNORECASE)
+
 
 class RotorConnection:
     """Manages a serial connection to the rotor controller.
@@ -57,6 +61,7 @@ class RotorConnection:
         self.status_lock = threading.Lock()
         self.write_lock = threading.Lock()
         self._on_unexpected_disconnect = on_unexpected_disconnect
+        self._status_listeners: List[Callable[[Dict[str, Any]], None]] = []
 
     def set_unexpected_disconnect_callback(
         self,
@@ -65,6 +70,16 @@ class RotorConnection:
         """Set callback invoked when a live connection is lost unexpectedly."""
         self._on_unexpected_disconnect = callback
 
+    def add_status_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback invoked from the read thread for every parsed status line."""
+        with self.status_lock:
+            self._status_listeners = [*self._status_listeners, listener]
+
+    def remove_status_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Unregister a status callback previously added with add_status_listener()."""
+        with self.status_lock:
+            self._status_listeners = [cb for cb in self._status_listeners if cb != listener]
+
     def is_connected(self) -> bool:
         """Check if connected to a port.
         
@@ -529,7 +544,7 @@ class RotorConnection:
         
         # Parse AZ=xxx
         # Expected format: AZ=123 EL=045
-        az_match = re.search(r'AZ\s*=\s*([^\s]+)', line, re.IGNORECASE)
+        az_match = _AZ_RE.search(line)
         if az_match:
             azimuth_raw = self._parse_status_value(az_match.group(1), "AZ")
             if azimuth_raw is not None:
@@ -537,7 +552,7 @@ class RotorConnection:
                 status["azimuth"] = azimuth_raw  # Legacy field
         
         # Parse EL=xxx
-        el_match = re.search(r'EL\s*=\s*([^\s]+)', line, re.IGNORECASE)
+        el_match = _EL_RE.search(line)
         if el_match:
             elevation_raw = self._parse_status_value(el_match.group(1), "EL")
             if elevation_raw is not None:
@@ -546,4 +561,11 @@ class RotorConnection:
         
         with self.status_lock:
             self.status = status
+            listeners = self._status_listeners
+
+        for listener in listeners:
+            try:
+                listener(status)
+            except Exception as e:
+                log(f"[RotorConnection] Status listener failed: {e}")
 
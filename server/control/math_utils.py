@@ -53,9 +53,13 @@ def shortest_angular_delta(
     if not range_val or range_val <= 0:
         return target - current
     delta = target - current
-    while delta > range_val / 2:
-        delta -= range_val
-    while delta < -range_val / 2:
-        delta += range_val
+    half = range_val / 2
+    # Fold in one step (no loop, so the cost does not grow with |delta|).
+    # Like repeated +/- range_val, positive overshoot lands in (-half, half]
+    # and negative overshoot in [-half, half).
+    if delta > half:
+        delta = half - (half - delta) % range_val
+    elif delta < -half:
+        delta = (delta + half) % range_val - half
     return delta
 
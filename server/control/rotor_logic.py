@@ -8,7 +8,7 @@ import time
 import threading
 import logging
 import re
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from server.control.math_utils import clamp, shortest_angular_delta
 
@@ -602,15 +602,28 @@ class RotorLogic:
             factor = 1.0
         return effective * factor
 
-    def get_effective_raw_status(self) -> Optional[Dict[str, float]]:
-        """Get current raw status with optional feedback correction applied."""
+    def add_status_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback for new telemetry from the connection."""
+        self.connection.add_status_listener(listener)
+
+    def remove_status_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Unregister a telemetry callback."""
+        self.connection.remove_status_listener(listener)
+
+    def get_effective_raw_position(self) -> Tuple[Optional[float], Optional[float]]:
+        """Get corrected raw (azimuth, elevation) without building a status dict."""
         status = self.connection.get_status()
         if not status:
-            return None
+            return None, None
 
-        az_raw = self._apply_feedback_correction(status.get("azimuthRaw"), "azimuthFeedbackFactor")
-        el_raw = self._apply_feedback_correction(status.get("elevationRaw"), "elevationFeedbackFactor")
+        return (
+            self._apply_feedback_correction(status.get("azimuthRaw"), "azimuthFeedbackFactor"),
+            self._apply_feedback_correction(status.get("elevationRaw"), "elevationFeedbackFactor"),
+        )
 
+    def get_effective_raw_status(self) -> Optional[Dict[str, float]]:
+        """Get current raw status with optional feedback correction applied."""
+        az_raw, el_raw = self.get_effective_raw_position()
         if az_raw is None and el_raw is None:
             return None
         return {"azimuth": az_raw, "elevation": el_raw}
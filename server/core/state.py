@@ -5,20 +5,26 @@ Provides centralized state management for all server components.
 
 from __future__ import annotations
 
+import functools
 import threading
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING, Any, Dict
+from typing import Optional, Any, Dict, Tuple
 
+from server.api.websocket import WebSocketManager
+from server.config.settings import SettingsManager
+from server.connection.serial_connection import RotorConnection
+from server.control.rotor_logic import RotorLogic
+from server.core.session_manager import SessionManager
 from server.paths import DEFAULT_CONFIG_DIR, DEFAULT_SERVER_ROOT, ensure_data_dir
+from server.routes.route_executor import RouteExecutor
+from server.routes.route_manager import RouteManager
+from server.utils.logging import log
 
-if TYPE_CHECKING:
-    from server.config.settings import SettingsManager
-    from server.connection.serial_connection import RotorConnection
-    from server.control.rotor_logic import RotorLogic
-    from server.api.websocket import WebSocketManager
-    from server.core.session_manager import SessionManager
-    from server.routes.route_manager import RouteManager
-    from server.routes.route_executor import RouteExecutor
+# Prefer fastrlock's cheaper reentrant lock for the rotor command path if available
+try:
+    from fastrlock.rlock import FastRLock as _RotorLock
+except ImportError:
+    from threading import RLock as _RotorLock
 
 
 class ServerState:
@@ -31,28 +37,13 @@ class ServerState:
     - WebSocket manager
     - Session manager
     - Thread locks
-    """
     
-    _instance: Optional["ServerState"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls) -> "ServerState":
-        """Create or return the singleton instance."""
-        if cls._instance is None:
-            with cls._lock:
-                # Double-check locking pattern
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    The shared instance is obtained via get_instance(); constructing the
+    class directly yields an independent state object.
+    """
 
     def __init__(self) -> None:
-        """Initialize the state (only runs once)."""
-        if self._initialized:
-            return
-        
-        self._initialized = True
-        
+        """Initialize the state."""
         # Configuration
         self.config_dir: Path = DEFAULT_CONFIG_DIR
         self.server_root: Path = DEFAULT_SERVER_ROOT
@@ -72,15 +63,16 @@ class ServerState:
         self.websocket_port: int = 8082
         self._restart_requested: bool = False
         
-        # Thread safety
-        self.rotor_lock = threading.Lock()
+        # Thread safety (reentrant; callers use ``with state.rotor_lock:``)
+        self.rotor_lock = _RotorLock()
         self._auto_reconnect_lock = threading.Lock()
         self._auto_reconnect_thread: Optional[threading.Thread] = None
         self._auto_reconnect_stop_event: Optional[threading.Event] = None
         self._manual_disconnect_requested = False
         self._shutdown_requested = False
-        self._last_connected_port: Optional[str] = None
-        self._last_connected_baud_rate: int = 9600
+        # (port, baud rate) of the last successful connection. Published as one
+        # tuple so readers on other threads never see a mixed pair.
+        self._last_connection: Tuple[Optional[str], int] = (None, 9600)
 
     def initialize(
         self,
@@ -97,16 +89,6 @@ class ServerState:
             http_port: Port for HTTP server (default: 8081).
             websocket_port: Port for WebSocket server (default: 8082).
         """
-        # Import here to avoid circular imports
-        from server.config.settings import SettingsManager
-        from server.connection.serial_connection import RotorConnection
-        from server.control.rotor_logic import RotorLogic
-        from server.api.websocket import WebSocketManager
-        from server.core.session_manager import SessionManager
-        from server.routes.route_manager import RouteManager
-        from server.routes.route_executor import RouteExecutor
-        from server.utils.logging import log
-        
         if config_dir:
             self.config_dir = Path(config_dir)
             self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -120,11 +102,11 @@ class ServerState:
         config = self.settings.get_all()
         self._shutdown_requested = False
         self._manual_disconnect_requested = False
-        self._last_connected_port = None
         try:
-            self._last_connected_baud_rate = int(config.get("baudRate", 9600) or 9600)
+            default_baud_rate = int(config.get("baudRate", 9600) or 9600)
         except (TypeError, ValueError):
-            self._last_connected_baud_rate = 9600
+            default_baud_rate = 9600
+        self._last_connection = (None, default_baud_rate)
         
         # Explicit CLI/API arguments take precedence over persisted defaults.
         self.http_port = int(http_port if http_port is not None else config.get("serverHttpPort", 8081))
@@ -160,6 +142,7 @@ class ServerState:
         
         # Cross-reference managers
         self.websocket_manager.set_session_manager(self.session_manager)
+        self.websocket_manager.set_server_state(self)
         self.session_manager.set_websocket_manager(self.websocket_manager)
         
         # Initialize route manager
@@ -188,7 +171,6 @@ class ServerState:
         Sets a flag that will be checked by the main loop to trigger
         a restart with exit code 42.
         """
-        from server.utils.logging import log
         log("[ServerState] Server restart requested")
         self._restart_requested = True
         self._shutdown_requested = True
@@ -208,6 +190,11 @@ class ServerState:
         self.notify_manual_disconnect_requested()
         if self.route_executor:
             self.route_executor.stop_route()
+        if self.route_manager:
+            try:
+                self.route_manager.flush()
+            except Exception as e:
+                log(f"[ServerState] Failed to save pending route changes: {e}", level="ERROR")
         if self.rotor_logic:
             self.rotor_logic.stop()
         if self.rotor_connection:
@@ -223,8 +210,6 @@ class ServerState:
 
     def shutdown_http_server(self) -> None:
         """Request the HTTP server to stop serving (causes serve_forever() to return)."""
-        from server.utils.logging import log
-
         if not self.http_server:
             log("[ServerState] No HTTP server instance set; cannot shutdown HTTP server", level="WARNING")
             return
@@ -274,8 +259,7 @@ class ServerState:
 
     def notify_connection_established(self, port: str, baud_rate: int) -> None:
         """Persist latest successful connection information."""
-        self._last_connected_port = port
-        self._last_connected_baud_rate = int(baud_rate)
+        self._last_connection = (port, int(baud_rate))
         self._manual_disconnect_requested = False
         self.cancel_auto_reconnect()
 
@@ -299,8 +283,6 @@ class ServerState:
 
     def _start_auto_reconnect(self, port: Optional[str], baud_rate: int) -> None:
         """Start background worker that reconnects to the last known COM port."""
-        from server.utils.logging import log
-
         if not port:
             log("[ServerState] Auto reconnect skipped: no target port available", level="WARNING")
             return
@@ -361,18 +343,16 @@ class ServerState:
 
     def _handle_unexpected_rotor_disconnect(self, event: Dict[str, Any]) -> None:
         """React to unexpected COM disconnect notifications from RotorConnection."""
-        from server.utils.logging import log
-
         if self._shutdown_requested or self._manual_disconnect_requested:
             return
 
-        lost_port = event.get("port") or self._last_connected_port
-        baud_rate = int(event.get("baudRate") or self._last_connected_baud_rate or 9600)
+        last_port, last_baud_rate = self._last_connection
+        lost_port = event.get("port") or last_port
+        baud_rate = int(event.get("baudRate") or last_baud_rate or 9600)
         reason = event.get("reason") or "unexpected_disconnect"
 
         if lost_port:
-            self._last_connected_port = lost_port
-            self._last_connected_baud_rate = baud_rate
+            self._last_connection = (lost_port, baud_rate)
 
         log(f"[ServerState] Unexpected rotor disconnect detected: port={lost_port} reason={reason}", level="WARNING")
 
@@ -389,12 +369,34 @@ class ServerState:
         Returns:
             The ServerState singleton instance.
         """
-        return cls()
+        return _singleton()
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance (for testing)."""
-        with cls._lock:
-            if cls._instance:
-                cls._instance.reset()
-            cls._instance = None
+        global _singleton_state
+        with _singleton_lock:
+            if _singleton_state is not None:
+                _singleton_state.reset()
+            _singleton_state = None
+            _singleton.cache_clear()
+
+
+# Guards the one-time construction behind the _singleton() cache
+_singleton_lock = threading.Lock()
+_singleton_state: Optional[ServerState] = None
+
+
+@functools.cache
+def _singleton() -> ServerState:
+    """Create the shared ServerState on first use and return it thereafter.
+    
+    functools.cache may run this body in several threads that miss the cache
+    at once, so construction is serialized on _singleton_lock and every
+    caller gets the same object. Later calls are plain cache hits.
+    """
+    global _singleton_state
+    with _singleton_lock:
+        if _singleton_state is None:
+            _singleton_state = ServerState()
+        return _singleton_state
@@ -18,6 +18,17 @@ if TYPE_CHECKING:
     from server.control.rotor_logic import RotorLogic
     from server.api.websocket import WebSocketManager
 
+# Progress events arriving within this window of the last send are coalesced
+# and flushed together at the end of the window, or once the batch is full
+PROGRESS_FLUSH_INTERVAL_S = 0.05
+PROGRESS_BATCH_MAX_EVENTS = 16
+# Progress types where only the newest pending event per step matters
+COALESCED_PROGRESS_TYPES = frozenset({"wait_progress"})
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing."""
+
 
 class RouteExecutor:
     """Executes routes in a background thread with progress updates.
@@ -52,18 +63,42 @@ class RouteExecutor:
         self._lock = threading.Lock()
         self._executing = False
         self._should_stop = False
+        self._stop_event = threading.Event()  # Set together with _should_stop to interrupt waits
         self._current_route_id: Optional[str] = None
         self._current_route_name: Optional[str] = None
         self._current_step_index = 0
         self._total_steps = 0
         self._execution_thread: Optional[threading.Thread] = None
         self._manual_continue_event: Optional[threading.Event] = None
+        # Set by rotor telemetry (and by stop) to wake the arrival wait
+        self._arrival_event = threading.Event()
         
         # Position arrival settings
         self.position_tolerance = 2.0  # degrees
         self.position_timeout = 60.0  # seconds
-        self.position_check_interval = 0.2  # seconds
+        self.position_check_interval = 0.2  # seconds (fallback if no telemetry arrives)
         self.manual_wait_check_interval = 0.2  # seconds
+        
+        # Step type -> handler
+        self._step_handlers = {
+            "position": self._execute_position_step,
+            "wait": self._execute_wait_step,
+            "loop": self._execute_loop_step,
+        }
+        
+        # Pending progress events (flushed as one WebSocket message)
+        self._progress_cond = threading.Condition()
+        self._progress_buffer: List[Dict[str, Any]] = []
+        self._progress_last_sent = 0.0
+        self._progress_flusher: Optional[threading.Thread] = None
+        
+        # Without a WebSocket manager every broadcast is a no-op; bind that once
+        # instead of checking on each call.
+        if websocket_manager is None:
+            self._broadcast_execution_started = _noop
+            self._broadcast_execution_stopped = _noop
+            self._broadcast_execution_completed = _noop
+            self._broadcast_progress = _noop
     
     def start_route(self, route_id: str) -> bool:
         """Start executing a route.
@@ -88,6 +123,7 @@ class RouteExecutor:
             # Reset state
             self._executing = True
             self._should_stop = False
+            self._stop_event.clear()
             self._current_route_id = route_id
             self._current_route_name = route.get("name", "Unnamed")
             self._current_step_index = 0
@@ -114,6 +150,8 @@ class RouteExecutor:
             
             log(f"[RouteExecutor] Stopping route: {self._current_route_name}")
             self._should_stop = True
+            self._stop_event.set()
+            self._arrival_event.set()
             
             # Wake up manual wait if active
             if self._manual_continue_event:
@@ -205,10 +243,15 @@ class RouteExecutor:
                 return
             
             if route_level:
-                with self._lock:
-                    self._current_step_index = i
+                # Only the executor thread writes the step index once running;
+                # a single attribute store needs no lock for readers.
+                self._current_step_index = i
             
             self._execute_step(step)
+            
+            if route_level:
+                # Deliver top-level step progress without waiting for the flusher
+                self._flush_progress()
     
     def _execute_step(self, step: Dict[str, Any]) -> None:
         """Execute a single step.
@@ -229,12 +272,9 @@ class RouteExecutor:
         })
         
         try:
-            if step_type == "position":
-                self._execute_position_step(step)
-            elif step_type == "wait":
-                self._execute_wait_step(step)
-            elif step_type == "loop":
-                self._execute_loop_step(step)
+            step_handler = self._step_handlers.get(step_type)
+            if step_handler is not None:
+                step_handler(step)
             else:
                 log(f"[RouteExecutor] Unknown step type: {step_type}", level="WARNING")
             
@@ -315,44 +355,56 @@ class RouteExecutor:
         Raises:
             RuntimeError: If the rotor disconnects while waiting.
         """
-        start_time = time.time()
-        
-        while not self._should_stop:
-            if not self.rotor_logic.connection.is_connected():
-                log("[RouteExecutor] Rotor disconnected during position wait – aborting step", level="WARNING")
-                raise RuntimeError("Rotor disconnected during route execution")
+        deadline = time.monotonic() + self.position_timeout
+        arrival_event = self._arrival_event
+        self.rotor_logic.add_status_listener(self._on_status_update)
 
-            # Get current position using corrected feedback values
-            current_status = self.rotor_logic.get_effective_raw_status()
-            
-            if not current_status:
-                time.sleep(self.position_check_interval)
-                continue
-            
-            current_az = current_status.get("azimuth")
-            current_el = current_status.get("elevation")
-            
-            # Check if within tolerance
-            az_ok = target_az is None or (
-                current_az is not None and abs(current_az - target_az) <= self.position_tolerance
-            )
-            el_ok = target_el is None or (
-                current_el is not None and abs(current_el - target_el) <= self.position_tolerance
-            )
-            
-            if az_ok and el_ok:
-                log("[RouteExecutor] Position reached within tolerance")
-                return True
-            
-            # Check timeout
-            if time.time() - start_time > self.position_timeout:
-                log("[RouteExecutor] Position arrival timeout - continuing anyway", level="WARNING")
-                return False
-            
-            # Wait before checking again
-            time.sleep(self.position_check_interval)
+        try:
+            while not self._should_stop:
+                # Clear before reading so telemetry arriving mid-check is not lost
+                arrival_event.clear()
+
+                if not self.rotor_logic.connection.is_connected():
+                    log("[RouteExecutor] Rotor disconnected during position wait – aborting step", level="WARNING")
+                    raise RuntimeError("Rotor disconnected during route execution")
+
+                # Get current position using corrected feedback values
+                current_az, current_el = self.rotor_logic.get_effective_raw_position()
+
+                if current_az is not None or current_el is not None:
+                    # Check if within tolerance
+                    az_ok = target_az is None or (
+                        current_az is not None and abs(current_az - target_az) <= self.position_tolerance
+                    )
+                    el_ok = target_el is None or (
+                        current_el is not None and abs(current_el - target_el) <= self.position_tolerance
+                    )
+
+                    if az_ok and el_ok:
+                        log("[RouteExecutor] Position reached within tolerance")
+                        return True
+
+                # Check timeout
+                remaining_s = deadline - time.monotonic()
+                if remaining_s <= 0:
+                    log("[RouteExecutor] Position arrival timeout - continuing anyway", level="WARNING")
+                    return False
+
+                # Sleep until new telemetry arrives (or stop), re-checking the
+                # connection at least every position_check_interval.
+                arrival_event.wait(min(remaining_s, self.position_check_interval))
+        finally:
+            self.rotor_logic.remove_status_listener(self._on_status_update)
 
         return False
+
+    def _on_status_update(self, status: Dict[str, Any]) -> None:
+        """Wake the arrival wait when the connection reports new telemetry.
+        
+        Args:
+            status: The freshly parsed status dictionary (unused).
+        """
+        self._arrival_event.set()
     
     def _execute_wait_step(self, step: Dict[str, Any]) -> None:
         """Execute a wait step - time-based or manual.
@@ -408,31 +460,35 @@ class RouteExecutor:
             duration_ms: Duration in milliseconds.
             step: Wait step dictionary.
         """
-        start_time = time.time()
         duration_s = duration_ms / 1000.0
-        update_interval = 0.1   # Check every 100 ms
-        broadcast_interval = 0.5  # Broadcast at most every 500 ms
-        last_broadcast_time = -broadcast_interval  # Trigger immediately on first iteration
+        broadcast_interval = 0.5  # Broadcast every 500 ms
+        start_time = time.monotonic()
+        deadline = start_time + duration_s
+        next_broadcast = start_time  # Trigger immediately on first iteration
 
         while not self._should_stop:
-            elapsed_s = time.time() - start_time
-            remaining_s = max(0, duration_s - elapsed_s)
+            now = time.monotonic()
 
-            # Broadcast progress at a stable interval (avoids int-modulo timing bugs)
-            if elapsed_s - last_broadcast_time >= broadcast_interval:
-                last_broadcast_time = elapsed_s
+            # Broadcast on a fixed schedule relative to the start (no drift)
+            if now >= next_broadcast:
+                elapsed_s = min(now - start_time, duration_s)
                 self._broadcast_progress({
                     "type": "wait_progress",
                     "step": step,
                     "elapsed": int(elapsed_s * 1000),
-                    "remaining": int(remaining_s * 1000),
+                    "remaining": int((duration_s - elapsed_s) * 1000),
                     "total": duration_ms
                 })
+                next_broadcast += broadcast_interval
+                if next_broadcast <= now:
+                    # Skip slots missed while the thread was descheduled
+                    next_broadcast = now + broadcast_interval
 
-            if elapsed_s >= duration_s:
+            if now >= deadline:
                 break
 
-            time.sleep(update_interval)
+            # Sleep until the next broadcast or the deadline; stop wakes it early
+            self._stop_event.wait(min(next_broadcast, deadline) - now)
     
     def _execute_loop_step(self, step: Dict[str, Any]) -> None:
         """Execute a loop step - repeat nested steps N times.
@@ -468,7 +524,7 @@ class RouteExecutor:
             nested_steps = step.get("steps", [])
             self._execute_steps(nested_steps, route_level=False)
             if is_infinite and not nested_steps:
-                time.sleep(self.position_check_interval)
+                self._stop_event.wait(self.position_check_interval)
             
             current_iteration += 1
         
@@ -484,11 +540,13 @@ class RouteExecutor:
             Total step count.
         """
         count = 0
-        for step in steps:
-            count += 1
-            if step.get("type") == "loop":
-                nested_steps = step.get("steps", [])
-                count += self._count_total_steps(nested_steps)
+        pending = [steps]
+        while pending:
+            current = pending.pop()
+            count += len(current)
+            for step in current:
+                if step.get("type") == "loop":
+                    pending.append(step.get("steps", []))
         return count
     
     def _broadcast_execution_started(self) -> None:
@@ -496,6 +554,7 @@ class RouteExecutor:
         if not self.websocket_manager:
             return
         
+        self._flush_progress()
         self.websocket_manager.broadcast_route_execution_started(
             self._current_route_id,
             self._current_route_name
@@ -506,6 +565,7 @@ class RouteExecutor:
         if not self.websocket_manager:
             return
         
+        self._flush_progress()
         self.websocket_manager.broadcast_route_execution_stopped()
     
     def _broadcast_execution_completed(self, success: bool, error: Optional[str] = None) -> None:
@@ -518,6 +578,7 @@ class RouteExecutor:
         if not self.websocket_manager:
             return
         
+        self._flush_progress()
         self.websocket_manager.broadcast_route_execution_completed(
             success=success,
             route_id=self._current_route_id,
@@ -525,7 +586,13 @@ class RouteExecutor:
         )
     
     def _broadcast_progress(self, progress_data: Dict[str, Any]) -> None:
-        """Broadcast execution progress.
+        """Send or queue an execution progress event.
+        
+        An event is sent right away unless another one went out within the
+        last PROGRESS_FLUSH_INTERVAL_S. Events of such a burst are queued and
+        sent together by the flusher thread at the end of the window, or once
+        PROGRESS_BATCH_MAX_EVENTS are pending. A pending event of a type in
+        COALESCED_PROGRESS_TYPES is replaced by a newer one for the same step.
         
         Args:
             progress_data: Progress data dictionary.
@@ -536,4 +603,74 @@ class RouteExecutor:
         payload = dict(progress_data)
         payload.setdefault("routeId", self._current_route_id)
         payload.setdefault("routeName", self._current_route_name)
-        self.websocket_manager.broadcast_route_execution_progress(payload)
+        
+        with self._progress_cond:
+            if payload.get("type") in COALESCED_PROGRESS_TYPES:
+                self._drop_pending_progress(payload)
+            self._progress_buffer.append(payload)
+            
+            in_burst = time.monotonic() - self._progress_last_sent < PROGRESS_FLUSH_INTERVAL_S
+            if not in_burst or len(self._progress_buffer) >= PROGRESS_BATCH_MAX_EVENTS:
+                self._send_pending_progress()
+                return
+            
+            if self._progress_flusher is None:
+                self._progress_flusher = threading.Thread(
+                    target=self._progress_flush_loop,
+                    name="RouteProgressFlusher",
+                    daemon=True
+                )
+                self._progress_flusher.start()
+            self._progress_cond.notify()
+    
+    def _drop_pending_progress(self, payload: Dict[str, Any]) -> None:
+        """Remove a pending event superseded by payload (caller holds _progress_cond).
+        
+        Args:
+            payload: The newer progress event.
+        """
+        event_type = payload.get("type")
+        step_id = (payload.get("step") or {}).get("id")
+        self._progress_buffer = [
+            event for event in self._progress_buffer
+            if event.get("type") != event_type
+            or (event.get("step") or {}).get("id") != step_id
+        ]
+    
+    def _progress_flush_loop(self) -> None:
+        """Flusher thread: send queued events once their burst window ends."""
+        with self._progress_cond:
+            while True:
+                while not self._progress_buffer:
+                    self._progress_cond.wait()
+                
+                remaining = self._progress_last_sent + PROGRESS_FLUSH_INTERVAL_S - time.monotonic()
+                while self._progress_buffer and remaining > 0:
+                    self._progress_cond.wait(remaining)
+                    remaining = self._progress_last_sent + PROGRESS_FLUSH_INTERVAL_S - time.monotonic()
+                
+                self._send_pending_progress()
+    
+    def _flush_progress(self) -> None:
+        """Send all pending progress events in order."""
+        with self._progress_cond:
+            self._send_pending_progress()
+    
+    def _send_pending_progress(self) -> None:
+        """Send the queued events (caller holds _progress_cond).
+        
+        A single pending event is sent as a regular route_execution_progress
+        message, several as one route_execution_progress_batch message.
+        """
+        events = self._progress_buffer
+        if not events or not self.websocket_manager:
+            return
+        self._progress_buffer = []
+        self._progress_last_sent = time.monotonic()
+        
+        # Sending only schedules work on the WebSocket loop, so holding the
+        # lock here is cheap and keeps concurrent sends in order.
+        if len(events) == 1:
+            self.websocket_manager.broadcast_route_execution_progress(events[0])
+        else:
+            self.websocket_manager.broadcast_route_execution_progress_batch(events)
@@ -5,16 +5,23 @@ Manages routes stored in routes.json with thread-safe operations.
 
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from server.paths import ensure_data_dir
+from server.utils.json_io import dump_json, load_json_file
 from server.utils.logging import log
 
+# Quiet period before pending route changes are written to disk
+SAVE_DEBOUNCE_S = 0.2
+# Delay before a failed background save is retried
+SAVE_RETRY_S = 5.0
+# Failed background saves in a row before retrying stops
+SAVE_MAX_RETRIES = 3
+
 
 class RouteManager:
     """Manages route storage and CRUD operations.
@@ -24,6 +31,15 @@ class RouteManager:
     - Saving routes to routes.json
     - CRUD operations (Create, Read, Update, Delete)
     - Thread-safe access
+    
+    CRUD calls write routes.json before returning unless called with
+    ``defer_save=True``; deferred edits are coalesced into one debounced write
+    (see ``flush()``).
+    
+    Routes are kept copy-on-write: writers serialize on ``_lock`` and publish
+    a new tuple (plus an id index), readers use whatever is current without
+    locking. Stored route dicts are never modified in place and are returned
+    without copying, so callers must treat them as read-only.
     """
     
     def __init__(self, routes_file: Optional[Path] = None) -> None:
@@ -34,28 +50,56 @@ class RouteManager:
         """
         self.routes_file = routes_file or ensure_data_dir() / "routes.json"
         self._lock = threading.Lock()
-        self._routes: List[Dict[str, Any]] = []
+        self._routes: Tuple[Dict[str, Any], ...] = ()
+        self._routes_by_id: Dict[str, Dict[str, Any]] = {}
+        self._save_timer: Optional[threading.Timer] = None
+        # Serializes disk writes; held without _lock so readers/writers of the
+        # in-memory routes never wait on file I/O.
+        self._save_lock = threading.Lock()
+        self._routes_version = 0
+        self._saved_version = 0
+        self._save_failures = 0
         
         # Load existing routes
         self._load_routes()
     
     def _load_routes(self) -> None:
-        """Load routes from JSON file."""
+        """Load routes from JSON file (the loaded state counts as saved)."""
         try:
             if self.routes_file.exists():
-                with open(self.routes_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._routes = data.get("routes", [])
-                    log(f"[RouteManager] Loaded {len(self._routes)} routes from {self.routes_file}")
+                data = load_json_file(self.routes_file)
+                self._set_routes(tuple(data.get("routes", [])))
+                log(f"[RouteManager] Loaded {len(self._routes)} routes from {self.routes_file}")
             else:
-                self._routes = []
+                self._set_routes(())
                 log(f"[RouteManager] No routes file found at {self.routes_file}, starting with empty list")
         except Exception as e:
             log(f"[RouteManager] Error loading routes: {e}", level="ERROR")
-            self._routes = []
+            self._set_routes(())
+        self._saved_version = self._routes_version
+    
+    def _set_routes(self, routes: Tuple[Dict[str, Any], ...]) -> None:
+        """Publish a new route tuple together with its id index.
+        
+        Args:
+            routes: The new ordered routes.
+        """
+        routes_by_id: Dict[str, Dict[str, Any]] = {}
+        for route in routes:
+            # First occurrence wins, matching the ordered lookup semantics
+            routes_by_id.setdefault(route.get("id"), route)
+        self._routes_by_id = routes_by_id
+        self._routes = routes
+        self._routes_version += 1
     
-    def _save_routes(self) -> None:
-        """Save routes to JSON file."""
+    def _save_routes(self, routes: Optional[Tuple[Dict[str, Any], ...]] = None) -> None:
+        """Save routes to JSON file atomically (temp file, fsync, replace).
+        
+        Args:
+            routes: Snapshot to write. Defaults to the current routes.
+        """
+        if routes is None:
+            routes = self._routes
         temp_path: Optional[str] = None
         try:
             # Ensure directory exists
@@ -67,14 +111,14 @@ class RouteManager:
                 suffix=".tmp"
             )
 
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump({"routes": self._routes}, f, indent=2, ensure_ascii=False)
+            with os.fdopen(fd, 'wb') as f:
+                dump_json({"routes": list(routes)}, f)
                 f.flush()
                 os.fsync(f.fileno())
 
             os.replace(temp_path, self.routes_file)
             temp_path = None
-            log(f"[RouteManager] Saved {len(self._routes)} routes to {self.routes_file}")
+            log(f"[RouteManager] Saved {len(routes)} routes to {self.routes_file}")
         except Exception as e:
             if temp_path:
                 try:
@@ -84,14 +128,77 @@ class RouteManager:
             log(f"[RouteManager] Error saving routes: {e}", level="ERROR")
             raise
     
+    def _schedule_save(self, delay: Optional[float] = None) -> None:
+        """Schedule a debounced save; must be called with ``_lock`` held.
+        
+        Each call restarts the quiet period, so a burst of edits results in a
+        single write of the final state.
+        
+        Args:
+            delay: Seconds to wait before writing. Defaults to SAVE_DEBOUNCE_S.
+        """
+        if delay is None:
+            delay = SAVE_DEBOUNCE_S
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(delay, self._flush_from_timer)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def _flush_from_timer(self) -> None:
+        """Timer callback for the debounced save; retries a few times on failure."""
+        try:
+            self.flush()
+        except Exception as e:
+            with self._lock:
+                self._save_failures += 1
+                if self._save_failures >= SAVE_MAX_RETRIES:
+                    log(
+                        f"[RouteManager] Background save failed {self._save_failures} times, "
+                        f"giving up; route changes are NOT saved until the next successful write: {e}",
+                        level="ERROR",
+                    )
+                    return
+                log(f"[RouteManager] Background save failed, retrying in {SAVE_RETRY_S}s: {e}", level="ERROR")
+                # A newer edit may already have scheduled its own save
+                if self._save_timer is None:
+                    self._schedule_save(SAVE_RETRY_S)
+    
+    def flush(self) -> None:
+        """Write pending route changes to disk immediately.
+        
+        Unsaved changes stay pending if the write fails, so a later flush
+        (an edit, the retry timer or shutdown) writes them.
+        
+        Raises:
+            Exception: If writing routes.json fails.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            # Nothing to write unless the routes changed since the last save
+            if self._routes_version <= self._saved_version:
+                return
+            # The tuple is immutable, so it can be written after releasing _lock
+            routes = self._routes
+            version = self._routes_version
+        
+        with self._save_lock:
+            # A concurrent flush may already have written a newer snapshot
+            if version <= self._saved_version:
+                return
+            self._save_routes(routes)
+            self._saved_version = version
+            self._save_failures = 0
+    
     def get_all_routes(self) -> List[Dict[str, Any]]:
         """Get all routes.
         
         Returns:
-            List of route dictionaries.
+            List of route dictionaries (read-only).
         """
-        with self._lock:
-            return [route.copy() for route in self._routes]
+        return list(self._routes)
     
     def get_route(self, route_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific route by ID.
@@ -100,25 +207,23 @@ class RouteManager:
             route_id: The route ID to find.
             
         Returns:
-            Route dictionary or None if not found.
+            Route dictionary (read-only) or None if not found.
         """
-        with self._lock:
-            for route in self._routes:
-                if route.get("id") == route_id:
-                    return route.copy()
-            return None
+        return self._routes_by_id.get(route_id)
     
-    def add_route(self, route: Dict[str, Any]) -> Dict[str, Any]:
+    def add_route(self, route: Dict[str, Any], defer_save: bool = False) -> Dict[str, Any]:
         """Add a new route.
         
         Args:
             route: Route dictionary with at least 'id', 'name', and 'steps'.
+            defer_save: Coalesce the write with other edits instead of saving now.
             
         Returns:
             The added route.
             
         Raises:
             ValueError: If route with same ID already exists.
+            Exception: If writing routes.json fails (the route stays added).
         """
         with self._lock:
             route_id = route.get("id")
@@ -126,68 +231,99 @@ class RouteManager:
                 raise ValueError("Route must have an 'id' field")
             
             # Check for duplicate ID
-            if any(r.get("id") == route_id for r in self._routes):
+            if route_id in self._routes_by_id:
                 raise ValueError(f"Route with ID '{route_id}' already exists")
             
-            # Add route
-            self._routes.append(route.copy())
-            
-            # Save to disk
-            self._save_routes()
+            # Add route (stored as our own copy so the caller's dict stays theirs)
+            stored = route.copy()
+            self._set_routes((*self._routes, stored))
+            if defer_save:
+                self._schedule_save()
             
             log(f"[RouteManager] Added route: {route.get('name', 'Unnamed')} ({route_id})")
-            return route.copy()
+        
+        # Save to disk
+        if not defer_save:
+            self.flush()
+        return stored
     
-    def update_route(self, route_id: str, route: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def update_route(
+        self, route_id: str, route: Dict[str, Any], defer_save: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """Update an existing route.
         
         Args:
             route_id: ID of the route to update.
             route: New route data.
+            defer_save: Coalesce the write with other edits instead of saving now.
             
         Returns:
             Updated route or None if not found.
+            
+        Raises:
+            Exception: If writing routes.json fails (the update stays applied).
         """
         with self._lock:
-            for i, r in enumerate(self._routes):
-                if r.get("id") == route_id:
-                    # Ensure ID doesn't change
-                    route["id"] = route_id
-                    self._routes[i] = route.copy()
-                    
-                    # Save to disk
-                    self._save_routes()
-                    
-                    log(f"[RouteManager] Updated route: {route.get('name', 'Unnamed')} ({route_id})")
-                    return route.copy()
+            existing = self._routes_by_id.get(route_id)
+            if existing is None:
+                log(f"[RouteManager] Route not found for update: {route_id}", level="WARNING")
+                return None
+            
+            # Ensure ID doesn't change
+            route["id"] = route_id
+            stored = route.copy()
+            i = next(index for index, r in enumerate(self._routes) if r is existing)
+            self._set_routes((*self._routes[:i], stored, *self._routes[i + 1:]))
+            if defer_save:
+                self._schedule_save()
             
-            log(f"[RouteManager] Route not found for update: {route_id}", level="WARNING")
-            return None
+            log(f"[RouteManager] Updated route: {route.get('name', 'Unnamed')} ({route_id})")
+        
+        # Save to disk
+        if not defer_save:
+            self.flush()
+        return stored
     
-    def delete_route(self, route_id: str) -> bool:
+    def delete_route(self, route_id: str, defer_save: bool = False) -> bool:
         """Delete a route.
         
         Args:
             route_id: ID of the route to delete.
+            defer_save: Coalesce the write with other edits instead of saving now.
             
         Returns:
             True if deleted, False if not found.
+            
+        Raises:
+            Exception: If writing routes.json fails (the route stays deleted).
         """
         with self._lock:
-            initial_length = len(self._routes)
-            self._routes = [r for r in self._routes if r.get("id") != route_id]
+            if route_id not in self._routes_by_id:
+                log(f"[RouteManager] Route not found for deletion: {route_id}", level="WARNING")
+                return False
             
-            if len(self._routes) < initial_length:
-                # Save to disk
-                self._save_routes()
-                
-                log(f"[RouteManager] Deleted route: {route_id}")
-                return True
+            self._set_routes(tuple(r for r in self._routes if r.get("id") != route_id))
+            if defer_save:
+                self._schedule_save()
             
-            log(f"[RouteManager] Route not found for deletion: {route_id}", level="WARNING")
-            return False
+            log(f"[RouteManager] Deleted route: {route_id}")
+        
+        # Save to disk
+        if not defer_save:
+            self.flush()
+        return True
     
     def reload(self) -> None:
-        """Reload routes from disk."""
+        """Reload routes from disk (pending changes are written first).
+        
+        Raises:
+            RuntimeError: If routes changed while the pending changes were
+                being written; reloading would discard them.
+            Exception: If writing the pending changes fails.
+        """
+        self.flush()
         with self._lock:
+            # An edit may have landed between flush() and taking the lock
+            if self._routes_version > self._saved_version:
+                raise RuntimeError("Routes changed during reload; unsaved changes are pending")
             self._load_routes()
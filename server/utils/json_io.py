@@ -0,0 +1,81 @@
+"""JSON file helpers.
+
+Uses orjson for parsing and serialization when it is installed and falls
+back to the standard library json module otherwise. Values orjson handles
+differently (integers beyond 64 bits, NaN/Infinity) also go through json, so
+the result does not depend on whether orjson is installed.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, BinaryIO, Union
+
+# Check if orjson is available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """Read and parse a UTF-8 JSON file.
+    
+    Args:
+        path: Path of the JSON file.
+        
+    Returns:
+        The parsed JSON value.
+        
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the content is not valid JSON.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity are accepted by json; invalid input still raises
+            pass
+    return json.loads(data)
+
+
+def _contains_non_finite(obj: Any) -> bool:
+    """Check whether a JSON value contains a NaN or infinite float.
+    
+    Args:
+        obj: The JSON-serializable value.
+        
+    Returns:
+        True if any float in obj is not finite.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite(value) for value in obj)
+    return False
+
+
+def dump_json(obj: Any, fp: BinaryIO) -> None:
+    """Write a value as indented UTF-8 JSON to a binary file object.
+    
+    Args:
+        obj: The JSON-serializable value.
+        fp: File object opened in binary write mode.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits
+            data = None
+        # orjson writes NaN/Infinity as null; only then is a scan needed
+        if data is not None and not (b"null" in data and _contains_non_finite(obj)):
+            fp.write(data)
+            return
+    fp.write(json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8'))
@@ -3,8 +3,9 @@
 Provides a centralized logging function with timestamp prefix and configurable log level.
 """
 
+import atexit
 import sys
-from datetime import datetime
+import time
 from enum import Enum
 from typing import Optional
 
@@ -17,8 +18,30 @@ class LogLevel(Enum):
     ERROR = 3
 
 
+# Numeric value per level name, so log() can filter without enum lookups
+_LEVEL_VALUES = {level.name: level.value for level in LogLevel}
+
 # Global log level (default: INFO)
 _current_log_level = LogLevel.INFO
+_current_log_level_value = _current_log_level.value
+
+# (second, formatted text) of the last log call; reused within that second
+_last_timestamp = (-1, "")
+
+# (stream, flush after each message) for the stdout last written to; files and
+# pipes are block-buffered, so they are flushed to keep logs live
+_stdout_flush_mode = (None, False)
+
+
+def _flush_stdout() -> None:
+    """Flush buffered log output on interpreter exit."""
+    try:
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+
+atexit.register(_flush_stdout)
 
 
 def set_logging_level(level: str) -> None:
@@ -30,13 +53,14 @@ def set_logging_level(level: str) -> None:
     Raises:
         ValueError: If level is not a valid log level name.
     """
-    global _current_log_level
+    global _current_log_level, _current_log_level_value
     
     level_upper = level.upper()
     if level_upper not in LogLevel.__members__:
         raise ValueError(f"Invalid log level: {level}. Must be one of: DEBUG, INFO, WARNING, ERROR")
     
     _current_log_level = LogLevel[level_upper]
+    _current_log_level_value = _current_log_level.value
     log(f"[Logging] Log level set to {level_upper}", force=True)
 
 
@@ -57,16 +81,38 @@ def log(message: str, level: str = "INFO", force: bool = False) -> None:
         level: Log level for this message (DEBUG, INFO, WARNING, ERROR).
         force: If True, log regardless of current level (for system messages).
     """
-    # Parse the message level
-    try:
-        msg_level = LogLevel[level.upper()]
-    except KeyError:
-        msg_level = LogLevel.INFO
+    global _last_timestamp, _stdout_flush_mode
+    
+    # Parse the message level (exact upper-case names skip str.upper())
+    msg_level_value = _LEVEL_VALUES.get(level)
+    if msg_level_value is None:
+        msg_level_value = _LEVEL_VALUES.get(level.upper(), LogLevel.INFO.value)
     
     # Check if we should log this message
-    if not force and msg_level.value < _current_log_level.value:
+    if not force and msg_level_value < _current_log_level_value:
         return
     
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}", file=sys.stdout, flush=True)
+    # No console at all (pythonw, frozen windowed build)
+    stream = sys.stdout
+    if stream is None:
+        return
+    
+    second = int(time.time())
+    cached_second, timestamp = _last_timestamp
+    if second != cached_second:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _last_timestamp = (second, timestamp)
+    
+    cached_stream, flush_each = _stdout_flush_mode
+    if stream is not cached_stream:
+        try:
+            flush_each = not stream.isatty()
+        except Exception:
+            flush_each = True
+        _stdout_flush_mode = (stream, flush_each)
+    
+    # A console is line-buffered already; only files and pipes need a flush
+    stream.write(f"[{timestamp}] {message}\n")
+    if flush_each:
+        stream.flush()
 
@@ -210,6 +210,13 @@ class WebSocketService {
           this.emit('route_execution_progress', payload);
           break;
         
+        case 'route_execution_progress_batch':
+          // Coalesced progress events, delivered in emission order
+          (payload.events || []).forEach((event) => {
+            this.emit('route_execution_progress', event);
+          });
+          break;
+        
         case 'route_execution_stopped':
           this.emit('route_execution_stopped', payload);
           break;
@@ -2,45 +2,68 @@
 
 import json
 import pytest
-import sys
 import threading
-from pathlib import Path
 from urllib.parse import urljoin
 import urllib.request
 import urllib.error
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
+from server.api.handler import RotorHandler
 from server.core.server import create_test_server
 from server.core.state import ServerState
 
+# Fixed request bodies shared by several tests
+EMPTY_JSON = b"{}"
+SET_TARGET_JSON = b'{"az": 180, "el": 45}'
+SINGLE_AXIS_TARGET_JSON = b'{"az": 20}'
+MANUAL_LEFT_JSON = b'{"direction": "left"}'
 
-@pytest.fixture
-def test_server(tmp_path):
-    """Create a test server instance."""
-    # Reset singleton for clean test
-    ServerState.reset_instance()
-    
-    # Create server
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _post_json(base_url, path, body):
+    """Build a JSON POST request for the test server."""
+    return urllib.request.Request(
+        urljoin(base_url, path), data=body, headers=_JSON_HEADERS, method="POST"
+    )
+
+
+@pytest.fixture(scope="module")
+def http_server(tmp_path_factory):
+    """Start one HTTP server shared by all tests in this module."""
+    server_dir = tmp_path_factory.mktemp("srv")
     server, state, base_url = create_test_server(
         port=0,  # Auto-assign port
-        config_dir=tmp_path,
-        server_root=tmp_path
+        config_dir=server_dir,
+        server_root=server_dir
     )
     
     # Start server in background thread
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # Short poll interval so shutdown() returns quickly
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
     thread.start()
     
-    yield base_url, state
+    yield base_url
     
     # Cleanup
     server.shutdown()
-    thread.join(timeout=5)
+    thread.join(timeout=0.2)  # shutdown() already waited for the loop
     server.server_close()
+    ServerState.reset_instance()
+
+
+@pytest.fixture
+def test_server(http_server, tmp_path):
+    """Give each test a fresh server state behind the shared HTTP server."""
+    # Reset singleton for clean test
+    ServerState.reset_instance()
+    state = ServerState.get_instance()
+    state.initialize(config_dir=tmp_path, server_root=tmp_path)
+    RotorHandler.state = state
+    
+    yield http_server, state
+    
     state.reset()
 
 
@@ -53,7 +76,7 @@ class TestSettingsAPI:
         
         with urllib.request.urlopen(urljoin(base_url, "/api/settings")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert "baudRate" in data
         assert data["baudRate"] == 9600
@@ -62,16 +85,11 @@ class TestSettingsAPI:
         """POST /api/settings should update settings."""
         base_url, state = test_server
         
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/settings"),
-            data=json.dumps({"mapSource": "google"}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/settings", b'{"mapSource": "google"}')
         
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert data["status"] == "ok"
         assert data["settings"]["mapSource"] == "google"
@@ -87,7 +105,7 @@ class TestApiDocumentation:
         with urllib.request.urlopen(urljoin(base_url, "/api/openapi.json")) as response:
             assert response.status == 200
             assert response.headers.get_content_type() == "application/json"
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["openapi"].startswith("3.")
         assert data["info"]["title"] == "Rotor Interface GS232B API"
@@ -165,13 +183,13 @@ class TestApiDocumentation:
         base_url, state = test_server
 
         with urllib.request.urlopen(urljoin(base_url, "/api/openapi.json")) as response:
-            data = json.load(response)
+            data = json.loads(response.read())
         status_get = data["paths"]["/api/rotor/status"]["get"]
         assert status_get["security"] == [{"XSessionID": []}, {}]
 
         state.settings.update({"serverRequireSession": True})
         with urllib.request.urlopen(urljoin(base_url, "/api/openapi.json")) as response:
-            data = json.load(response)
+            data = json.loads(response.read())
         status_get = data["paths"]["/api/rotor/status"]["get"]
         assert status_get["security"] == [{"XSessionID": []}]
 
@@ -185,7 +203,7 @@ class TestRotorPortsAPI:
         
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/ports")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert "ports" in data
         assert isinstance(data["ports"], list)
@@ -200,7 +218,7 @@ class TestRotorStatusAPI:
         
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/status")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert data["connected"] == False
         assert data["clientCount"] == 0
@@ -226,7 +244,7 @@ class TestRotorStatusAPI:
         
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/status")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert data["connected"] == True
         assert data["port"] == "COM3"
@@ -272,7 +290,7 @@ class TestRotorStatusAPI:
 
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/status")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["connected"] is False
 
@@ -299,7 +317,7 @@ class TestRotorStatusAPI:
 
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/status")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["status"]["rph"]["azimuth"] == 90
         assert data["status"]["rph"]["elevation"] == 45
@@ -331,7 +349,7 @@ class TestRotorStatusAPI:
 
         with urllib.request.urlopen(urljoin(base_url, "/api/rotor/position")) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["position"]["rph"]["azimuth"] == 90
         assert data["position"]["rph"]["elevation"] == 45
@@ -346,12 +364,7 @@ class TestRotorConnectAPI:
         """POST /api/rotor/connect without port should return error."""
         base_url, state = test_server
         
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/connect"),
-            data=json.dumps({}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/connect", EMPTY_JSON)
         
         with pytest.raises(urllib.error.HTTPError) as exc_info:
             urllib.request.urlopen(request)
@@ -364,12 +377,7 @@ class TestRotorConnectAPI:
         """POST /api/rotor/connect with malformed JSON should return a JSON parse error."""
         base_url, state = test_server
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/connect"),
-            data=b'{"port": "COM3"',
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/connect", b'{"port": "COM3"')
 
         with pytest.raises(urllib.error.HTTPError) as exc_info:
             urllib.request.urlopen(request)
@@ -383,12 +391,7 @@ class TestRotorConnectAPI:
         base_url, state = test_server
         state.rotor_connection = None
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/connect"),
-            data=json.dumps({"port": "COM3"}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/connect", b'{"port": "COM3"}')
 
         with pytest.raises(urllib.error.HTTPError) as exc_info:
             urllib.request.urlopen(request)
@@ -405,16 +408,11 @@ class TestRotorDisconnectAPI:
         """POST /api/rotor/disconnect when not connected should succeed."""
         base_url, state = test_server
         
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/disconnect"),
-            data=json.dumps({}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/disconnect", EMPTY_JSON)
         
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
         
         assert data["status"] == "ok"
 
@@ -448,16 +446,11 @@ class TestRotorDisconnectAPI:
         state.rotor_connection.disconnect = MagicMock(side_effect=disconnect)
         state.rotor_connection.send_command = MagicMock()
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/disconnect"),
-            data=json.dumps({}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/disconnect", EMPTY_JSON)
 
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["status"] == "ok"
         assert events == ["status", "disconnect"]
@@ -468,24 +461,23 @@ class TestRotorDisconnectAPI:
 class TestRotorControlAPI:
     """Tests for the rotor control API endpoints."""
     
-    def test_set_target_requires_connection(self, test_server):
-        """POST /api/rotor/set_target should require connection."""
+    @pytest.mark.parametrize("endpoint,body", [
+        ("/api/rotor/set_target", SET_TARGET_JSON),
+        ("/api/rotor/set_target_raw", SET_TARGET_JSON),
+        ("/api/rotor/manual", MANUAL_LEFT_JSON),
+        ("/api/rotor/stop", EMPTY_JSON),
+    ])
+    def test_control_requires_connection(self, test_server, endpoint, body):
+        """Control endpoints should fail with the disconnected error when not connected."""
         base_url, state = test_server
         
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/set_target"),
-            data=json.dumps({"az": 180, "el": 45}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, endpoint, body)
         
-        # Should fail with 400 when not connected
         with pytest.raises(urllib.error.HTTPError) as exc_info:
             urllib.request.urlopen(request)
         
         assert exc_info.value.code == 400
         error_data = json.loads(exc_info.value.read().decode("utf-8"))
-        assert "error" in error_data
         assert "Not connected" in error_data["error"]
         assert error_data["code"] == "ROTOR_DISCONNECTED"
 
@@ -497,60 +489,16 @@ class TestRotorControlAPI:
         state.rotor_connection.is_connected = MagicMock(return_value=True)
         state.rotor_logic.set_target = MagicMock(return_value={"azimuth": 100.0, "elevation": None})
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/set_target"),
-            data=json.dumps({"az": 20}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/set_target", SINGLE_AXIS_TARGET_JSON)
 
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["status"] == "ok"
         assert data["appliedTarget"] == {"azimuth": 100.0, "elevation": None}
         state.rotor_logic.set_target.assert_called_once_with(20.0, None)
     
-    def test_manual_move_requires_connection(self, test_server):
-        """POST /api/rotor/manual should require connection."""
-        base_url, state = test_server
-        
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/manual"),
-            data=json.dumps({"direction": "left"}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-        
-        # Should fail with 400 when not connected
-        with pytest.raises(urllib.error.HTTPError) as exc_info:
-            urllib.request.urlopen(request)
-        
-        assert exc_info.value.code == 400
-        error_data = json.loads(exc_info.value.read().decode("utf-8"))
-        assert "error" in error_data
-        assert "Not connected" in error_data["error"]
-        assert error_data["code"] == "ROTOR_DISCONNECTED"
-
-    def test_set_target_raw_requires_connection(self, test_server):
-        """POST /api/rotor/set_target_raw should return normalized disconnected error."""
-        base_url, state = test_server
-
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/set_target_raw"),
-            data=json.dumps({"az": 180, "el": 45}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with pytest.raises(urllib.error.HTTPError) as exc_info:
-            urllib.request.urlopen(request)
-
-        assert exc_info.value.code == 400
-        error_data = json.loads(exc_info.value.read().decode("utf-8"))
-        assert error_data["code"] == "ROTOR_DISCONNECTED"
-
     def test_set_target_raw_returns_applied_target(self, test_server):
         """POST /api/rotor/set_target_raw should report the target after clamping."""
         base_url, state = test_server
@@ -559,39 +507,16 @@ class TestRotorControlAPI:
         state.rotor_connection.is_connected = MagicMock(return_value=True)
         state.rotor_logic.set_target_raw = MagicMock(return_value={"azimuth": 100.0, "elevation": None})
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/set_target_raw"),
-            data=json.dumps({"az": 20}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/set_target_raw", SINGLE_AXIS_TARGET_JSON)
 
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["status"] == "ok"
         assert data["appliedTarget"] == {"azimuth": 100.0, "elevation": None}
         state.rotor_logic.set_target_raw.assert_called_once_with(20.0, None)
     
-    def test_stop(self, test_server):
-        """POST /api/rotor/stop should fail with disconnected error when not connected."""
-        base_url, state = test_server
-        
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/stop"),
-            data=json.dumps({}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with pytest.raises(urllib.error.HTTPError) as exc_info:
-            urllib.request.urlopen(request)
-
-        assert exc_info.value.code == 400
-        error_data = json.loads(exc_info.value.read().decode("utf-8"))
-        assert error_data["code"] == "ROTOR_DISCONNECTED"
-
     def test_send_command_returns_disconnected_code_on_runtime_disconnect(self, test_server):
         """POST /api/rotor/command should return 400 with code when link drops during send."""
         base_url, state = test_server
@@ -600,12 +525,7 @@ class TestRotorControlAPI:
         state.rotor_connection.is_connected = MagicMock(return_value=True)
         state.rotor_connection.send_command = MagicMock(side_effect=RuntimeError("Not connected to rotor"))
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/rotor/command"),
-            data=json.dumps({"command": "C2"}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/rotor/command", b'{"command": "C2"}')
 
         with pytest.raises(urllib.error.HTTPError) as exc_info:
             urllib.request.urlopen(request)
@@ -623,16 +543,11 @@ class TestServerSettingsAPI:
         base_url, state = test_server
         assert int(state.rotor_connection.polling_interval_s * 1000) == 500
 
-        request = urllib.request.Request(
-            urljoin(base_url, "/api/server/settings"),
-            data=json.dumps({"serverPollingIntervalMs": 250}).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        request = _post_json(base_url, "/api/server/settings", b'{"serverPollingIntervalMs": 250}')
 
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
-            data = json.load(response)
+            data = json.loads(response.read())
 
         assert data["status"] == "ok"
         assert int(state.rotor_connection.polling_interval_s * 1000) == 250
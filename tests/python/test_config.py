@@ -1,17 +1,12 @@
 """Tests for the configuration management module."""
 
 import json
-import pytest
 import sys
-from pathlib import Path
-
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
 from server.config.defaults import DEFAULT_CONFIG
 from server.config.settings import SettingsManager
+from server.utils import json_io
 
 
 class TestDefaults:
@@ -165,3 +160,31 @@ class TestSettingsManager:
         assert config["elevationMinLimit"] == 0
         assert config["elevationMaxLimit"] == 90
 
+    def test_get_all_returns_read_only_snapshot(self, settings):
+        """get_all should return a read-only snapshot unaffected by later updates."""
+        before = settings.get_all()
+        with pytest.raises(TypeError):
+            before["baudRate"] = 1200
+
+        settings.update({"baudRate": 4800})
+        assert before["baudRate"] == 9600
+        assert settings.get_all()["baudRate"] == 4800
+
+    def test_non_finite_number_in_file_falls_back_to_defaults(self, settings_dir):
+        """Overflowing numbers in the settings file must not stop the server."""
+        (settings_dir / "web-settings.json").write_text('{"azimuthMode": "1e400"}')
+
+        settings = SettingsManager(settings_dir)
+
+        assert settings.get("azimuthMaxLimit") == DEFAULT_CONFIG["azimuthMode"]
+
+    def test_deeply_nested_file_falls_back_to_defaults(self, settings_dir, monkeypatch):
+        """A settings file nested too deeply to parse must not stop the server."""
+        # The stdlib decoder is the one that hits the recursion limit
+        monkeypatch.setattr(json_io, "ORJSON_AVAILABLE", False)
+        depth = sys.getrecursionlimit() * 2
+        (settings_dir / "web-settings.json").write_text("[" * depth + "]" * depth)
+
+        settings = SettingsManager(settings_dir)
+
+        assert settings.get("azimuthMode") == DEFAULT_CONFIG["azimuthMode"]
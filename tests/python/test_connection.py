@@ -1,16 +1,9 @@
 """Tests for the serial connection module."""
 
 import pytest
-import sys
 import threading
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from server.connection.port_scanner import list_available_ports, SERIAL_AVAILABLE
 import server.connection.serial_connection as serial_connection_module
 from server.connection.serial_connection import RotorConnection
@@ -162,6 +155,18 @@ class TestRotorConnectionMocked:
         assert "azimuthRaw" not in status
         assert status["elevationRaw"] == 45
 
+    def test_status_listeners_receive_parsed_status(self, connected_connection):
+        """Registered status listeners should be called with each parsed status."""
+        received = []
+        connected_connection.add_status_listener(received.append)
+
+        connected_connection._process_status_line("AZ=090 EL=045")
+        connected_connection.remove_status_listener(received.append)
+        connected_connection._process_status_line("AZ=100 EL=045")
+
+        assert len(received) == 1
+        assert received[0]["azimuthRaw"] == 90
+
     def test_connect_closes_port_when_startup_fails(self):
         """connect should close an opened port if setup fails after Serial() succeeds."""
         connection = RotorConnection()
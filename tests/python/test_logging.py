@@ -0,0 +1,31 @@
+"""Tests for the log() helper."""
+
+import io
+import sys
+
+from server.utils.logging import log
+
+
+def test_log_without_stdout_does_nothing(monkeypatch):
+    """Builds without a console set sys.stdout to None; logging must not crash."""
+    monkeypatch.setattr(sys, "stdout", None)
+
+    log("no console", force=True)
+
+
+def test_log_flushes_when_stdout_is_not_a_terminal(monkeypatch):
+    """Output to a file or pipe should be visible right after each message."""
+    class CountingStream(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            super().flush()
+
+    stream = CountingStream()
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    log("to a pipe", force=True)
+
+    assert stream.getvalue().endswith("] to a pipe\n")
+    assert stream.flushes == 1
@@ -1,13 +1,6 @@
 """Tests for the math utilities module."""
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
 from server.control.math_utils import clamp, wrap_azimuth, shortest_angular_delta
 
@@ -108,3 +101,14 @@ class TestShortestAngularDelta:
         """Negative range should return simple difference."""
         assert shortest_angular_delta(100, 50, -10) == 50
 
+    def test_half_range_keeps_direction(self):
+        """Exactly half a turn should keep the sign of the raw difference."""
+        assert shortest_angular_delta(180, 0, 360) == 180
+        assert shortest_angular_delta(0, 180, 360) == -180
+        assert shortest_angular_delta(540, 0, 360) == 180
+        assert shortest_angular_delta(0, 540, 360) == -180
+
+    def test_large_delta_folds_into_range(self):
+        """Deltas many turns away should fold into half a turn."""
+        assert shortest_angular_delta(3600 * 1000 + 20, 0, 360) == 20
+        assert shortest_angular_delta(0, 3600 * 1000 + 20, 360) == -20
@@ -1,42 +1,45 @@
 """Tests for the rotor logic module."""
 
 import pytest
-import sys
 import time
-from pathlib import Path
-from unittest.mock import Mock, MagicMock
-
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from unittest.mock import Mock
 
 from server.control.rotor_logic import RotorLogic
 
 
+class FakeConnection:
+    """Minimal stand-in for RotorConnection that records sent commands."""
+
+    def __init__(self, status):
+        self.status = status
+        self.sent = []
+
+    def is_connected(self):
+        return True
+
+    def get_status(self):
+        return self.status
+
+    def send_command(self, command):
+        self.sent.append(command)
+
+
 class TestRotorLogicDirectionMapping:
     """Tests for direction mapping."""
     
-    def test_direction_map_contains_abstract_directions(self):
-        """DIRECTION_MAP should contain abstract directions."""
-        assert 'left' in RotorLogic.DIRECTION_MAP
-        assert 'right' in RotorLogic.DIRECTION_MAP
-        assert 'up' in RotorLogic.DIRECTION_MAP
-        assert 'down' in RotorLogic.DIRECTION_MAP
-    
-    def test_direction_map_contains_protocol_commands(self):
-        """DIRECTION_MAP should contain protocol commands."""
-        assert 'L' in RotorLogic.DIRECTION_MAP
-        assert 'R' in RotorLogic.DIRECTION_MAP
-        assert 'U' in RotorLogic.DIRECTION_MAP
-        assert 'D' in RotorLogic.DIRECTION_MAP
-    
-    def test_abstract_to_protocol_mapping(self):
-        """Abstract directions should map to correct protocol commands."""
-        assert RotorLogic.DIRECTION_MAP['left'] == 'L'
-        assert RotorLogic.DIRECTION_MAP['right'] == 'R'
-        assert RotorLogic.DIRECTION_MAP['up'] == 'U'
-        assert RotorLogic.DIRECTION_MAP['down'] == 'D'
+    @pytest.mark.parametrize("direction,expected", [
+        ('left', 'L'),
+        ('right', 'R'),
+        ('up', 'U'),
+        ('down', 'D'),
+        ('L', 'L'),
+        ('R', 'R'),
+        ('U', 'U'),
+        ('D', 'D'),
+    ])
+    def test_direction_map(self, direction, expected):
+        """Abstract directions and protocol commands should map to protocol commands."""
+        assert RotorLogic.DIRECTION_MAP.get(direction) == expected
 
 
 class TestRotorLogic:
@@ -45,14 +48,11 @@ class TestRotorLogic:
     @pytest.fixture
     def mock_connection(self):
         """Create a mock connection."""
-        connection = MagicMock()
-        connection.is_connected.return_value = True
-        connection.get_status.return_value = {
+        return FakeConnection({
             "azimuthRaw": 180,
             "elevationRaw": 45,
-            "timestamp": int(time.time() * 1000)
-        }
-        return connection
+            "timestamp": 0
+        })
     
     @pytest.fixture
     def logic(self, mock_connection):
@@ -117,23 +117,61 @@ class TestRotorLogic:
         """stop_motion should send S command when ramp disabled."""
         logic.config["rampEnabled"] = False
         logic.stop_motion()
-        mock_connection.send_command.assert_called_with("S")
+        assert mock_connection.sent[-1] == "S"
     
-    def test_update_config(self, logic):
+    @pytest.mark.parametrize("updates,expected", [
+        (
+            {
+                "softLimitsEnabled": True,
+                "azimuthMinLimit": 10,
+                "azimuthMaxLimit": 350,
+                "azimuthMode": 450,
+                "rampEnabled": True
+            },
+            {
+                "softLimitsEnabled": True,
+                "azimuthMin": 10,
+                "azimuthMax": 350,
+                "azimuthMode": 450,
+                "rampEnabled": True
+            },
+        ),
+        (
+            {
+                "azimuthOffset": 5.0,
+                "elevationOffset": -2.0,
+                "azimuthScaleFactor": 1.1,
+                "elevationScaleFactor": 0.9
+            },
+            {
+                "azimuthOffset": 5.0,
+                "elevationOffset": -2.0,
+                "azimuthScaleFactor": 1.1,
+                "elevationScaleFactor": 0.9
+            },
+        ),
+        (
+            {
+                "feedbackCorrectionEnabled": True,
+                "azimuthFeedbackFactor": 2.0,
+                "elevationFeedbackFactor": 1.5
+            },
+            {
+                "feedbackCorrectionEnabled": True,
+                "azimuthFeedbackFactor": 2.0,
+                "elevationFeedbackFactor": 1.5
+            },
+        ),
+    ], ids=["limits", "calibration", "feedback_correction"])
+    def test_update_config(self, logic, updates, expected):
         """update_config should update configuration values."""
-        logic.update_config({
-            "softLimitsEnabled": True,
-            "azimuthMinLimit": 10,
-            "azimuthMaxLimit": 350,
-            "azimuthMode": 450,
-            "rampEnabled": True
-        })
+        logic.update_config(updates)
         
-        assert logic.config["softLimitsEnabled"] is True
-        assert logic.config["azimuthMin"] == 10
-        assert logic.config["azimuthMax"] == 350
-        assert logic.config["azimuthMode"] == 450
-        assert logic.config["rampEnabled"] == True
+        for key, value in expected.items():
+            if isinstance(value, bool):
+                assert logic.config[key] is value, key
+            else:
+                assert logic.config[key] == value, key
 
     def test_update_config_normalizes_azimuth_mode_to_int(self, logic):
         """Azimuth mode should be stored as an integer mode selector."""
@@ -142,32 +180,6 @@ class TestRotorLogic:
         assert logic.config["azimuthMode"] == 450
         assert isinstance(logic.config["azimuthMode"], int)
     
-    def test_update_config_calibration(self, logic):
-        """update_config should update calibration values."""
-        logic.update_config({
-            "azimuthOffset": 5.0,
-            "elevationOffset": -2.0,
-            "azimuthScaleFactor": 1.1,
-            "elevationScaleFactor": 0.9
-        })
-        
-        assert logic.config["azimuthOffset"] == 5.0
-        assert logic.config["elevationOffset"] == -2.0
-        assert logic.config["azimuthScaleFactor"] == 1.1
-        assert logic.config["elevationScaleFactor"] == 0.9
-
-    def test_update_config_feedback_correction(self, logic):
-        """update_config should update feedback correction settings."""
-        logic.update_config({
-            "feedbackCorrectionEnabled": True,
-            "azimuthFeedbackFactor": 2.0,
-            "elevationFeedbackFactor": 1.5
-        })
-
-        assert logic.config["feedbackCorrectionEnabled"] is True
-        assert logic.config["azimuthFeedbackFactor"] == 2.0
-        assert logic.config["elevationFeedbackFactor"] == 1.5
-
     def test_send_direct_target_el_only_uses_hardware_raw_azimuth(self, logic, mock_connection):
         """Elevation-only W command should use hardware raw azimuth (not feedback-corrected)."""
         logic.update_config({
@@ -176,7 +188,7 @@ class TestRotorLogic:
             "elevationFeedbackFactor": 2.0,
             "azimuthMode": 450
         })
-        mock_connection.get_status.return_value = {
+        mock_connection.status = {
             "azimuthRaw": 90,
             "elevationRaw": 30
         }
@@ -185,7 +197,7 @@ class TestRotorLogic:
 
         # AZ: hardware raw = 90 (unchanged, not multiplied by feedback)
         # EL: calibrated=30, hardware_raw = ((30*1)-0)/2 = 15
-        mock_connection.send_command.assert_called_with("W090 015")
+        assert mock_connection.sent[-1] == "W090 015"
 
     def test_set_target_clamps_to_active_soft_limits(self, logic, mock_connection):
         """Calibrated targets outside active limits should be clamped before sending."""
@@ -202,11 +214,11 @@ class TestRotorLogic:
 
         assert logic.target_az == 10
         assert logic.target_el == 80
-        mock_connection.send_command.assert_called_with("W010 080")
+        assert mock_connection.sent[-1] == "W010 080"
 
     def test_set_target_450_candidate_clamps_to_correct_boundary(self, logic, mock_connection):
         """Ambiguous 450-degree requests should choose a candidate before min/max clamping."""
-        mock_connection.get_status.return_value = {
+        mock_connection.status = {
             "azimuthRaw": 400,
             "elevationRaw": 45
         }
@@ -220,7 +232,7 @@ class TestRotorLogic:
         logic.set_target(10, None)
 
         assert logic.target_az == 300
-        mock_connection.send_command.assert_called_with("M300")
+        assert mock_connection.sent[-1] == "M300"
 
     def test_set_target_raw_clamps_to_active_soft_limits(self, logic, mock_connection):
         """Raw targets should also respect active software limits."""
@@ -234,7 +246,7 @@ class TestRotorLogic:
         applied = logic.set_target_raw(20, None)
 
         assert applied["azimuth"] == 100
-        mock_connection.send_command.assert_called_with("M100")
+        assert mock_connection.sent[-1] == "M100"
 
     def test_direct_position_command_is_sanitized_when_limits_active(self, logic):
         """Direct M/W commands should be rewritten to bounded hardware targets."""
@@ -253,7 +265,7 @@ class TestRotorLogic:
 
     def test_direct_manual_command_is_sanitized_when_limits_active(self, logic, mock_connection):
         """Direct L/R/U/D commands should become bounded target commands."""
-        mock_connection.get_status.return_value = {
+        mock_connection.status = {
             "azimuthRaw": 200,
             "elevationRaw": 45
         }
@@ -285,7 +297,7 @@ class TestRotorLogic:
 
         assert logic.target_az == 300
         assert logic.manual_direction is None
-        mock_connection.send_command.assert_called_with("M300")
+        assert mock_connection.sent[-1] == "M300"
 
     def test_update_config_resends_clamped_target_when_limits_enabled(self, logic, mock_connection):
         """Enabling limits should correct an already queued direct target."""
@@ -294,7 +306,7 @@ class TestRotorLogic:
             "rampEnabled": False
         })
         logic.set_target(350, None)
-        mock_connection.send_command.reset_mock()
+        mock_connection.sent.clear()
 
         logic.update_config({
             "softLimitsEnabled": True,
@@ -305,7 +317,7 @@ class TestRotorLogic:
         })
 
         assert logic.target_az == 300
-        mock_connection.send_command.assert_called_with("M300")
+        assert mock_connection.sent[-1] == "M300"
 
     def test_handle_target_ramp_does_not_clear_newer_target(self, logic):
         """Stale control-loop snapshots must not clear a newer target."""
@@ -346,13 +358,10 @@ class TestRotorLogicCalibration:
     @pytest.fixture
     def mock_connection(self):
         """Create a mock connection with status."""
-        connection = MagicMock()
-        connection.is_connected.return_value = True
-        connection.get_status.return_value = {
+        return FakeConnection({
             "azimuthRaw": 180,
             "elevationRaw": 45
-        }
-        return connection
+        })
     
     @pytest.fixture
     def logic(self, mock_connection):
@@ -1,21 +1,27 @@
 """Tests for route execution behavior with corrected feedback values."""
 
-import sys
+import threading
 import time
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
+import server.routes.route_executor as route_executor_module
 from server.control.rotor_logic import RotorLogic
 from server.routes.route_executor import RouteExecutor
 
 
+def _sent_progress_events(websocket_manager):
+    """Collect progress events from single and batched broadcasts in send order."""
+    events = []
+    for name, args, _ in websocket_manager.method_calls:
+        if name == "broadcast_route_execution_progress":
+            events.append(args[0])
+        elif name == "broadcast_route_execution_progress_batch":
+            events.extend(args[0])
+    return events
+
+
 def test_wait_for_arrival_uses_feedback_corrected_raw_values():
     """Arrival detection should use corrected raw values, not adapter raw values."""
     connection = MagicMock()
@@ -85,10 +91,8 @@ def test_position_step_waits_for_feedback_corrected_applied_target():
         "elevation": 45,
     })
 
-    progress_events = [
-        call.args[0]
-        for call in websocket_manager.broadcast_route_execution_progress.call_args_list
-    ]
+    executor._flush_progress()
+    progress_events = _sent_progress_events(websocket_manager)
 
     assert any(event["type"] == "position_reached" for event in progress_events)
     assert not any(event["type"] == "position_timeout" for event in progress_events)
@@ -99,6 +103,7 @@ def test_wait_for_arrival_raises_when_rotor_disconnects():
     """A lost rotor connection during route execution should fail the route."""
     rotor_logic = MagicMock()
     rotor_logic.get_effective_raw_status.return_value = None
+    rotor_logic.get_effective_raw_position.return_value = (None, None)
     rotor_logic.connection.is_connected.return_value = False
 
     executor = RouteExecutor(
@@ -119,6 +124,7 @@ def test_wait_for_arrival_raises_on_disconnect_even_with_cached_status():
         "azimuth": 180,
         "elevation": 45,
     }
+    rotor_logic.get_effective_raw_position.return_value = (180, 45)
     rotor_logic.connection.is_connected.return_value = False
 
     executor = RouteExecutor(
@@ -129,3 +135,160 @@ def test_wait_for_arrival_raises_on_disconnect_even_with_cached_status():
 
     with pytest.raises(RuntimeError, match="Rotor disconnected"):
         executor._wait_for_arrival(180, 45)
+
+
+def test_wait_for_arrival_wakes_on_status_update():
+    """New telemetry should end the arrival wait without waiting a full poll interval."""
+    connection = MagicMock()
+    connection.is_connected.return_value = True
+    connection.get_status.return_value = {"azimuthRaw": 0, "elevationRaw": 0}
+    listeners = []
+    connection.add_status_listener.side_effect = listeners.append
+
+    logic = RotorLogic(connection)
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=logic,
+        websocket_manager=None
+    )
+    executor.position_tolerance = 1.0
+    executor.position_timeout = 5.0
+    executor.position_check_interval = 5.0
+
+    def arrive():
+        time.sleep(0.05)
+        status = {"azimuthRaw": 90, "elevationRaw": 45}
+        connection.get_status.return_value = status
+        for listener in listeners:
+            listener(status)
+
+    threading.Thread(target=arrive, daemon=True).start()
+
+    started = time.time()
+    reached = executor._wait_for_arrival(90, 45)
+    elapsed = time.time() - started
+
+    assert reached is True
+    assert elapsed < 1.0
+    connection.remove_status_listener.assert_called_once()
+
+
+def test_lone_progress_event_is_sent_immediately():
+    """An event outside a burst should not wait for the flush window."""
+    websocket_manager = MagicMock()
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=websocket_manager
+    )
+
+    executor._broadcast_progress({"type": "step_started"})
+
+    websocket_manager.broadcast_route_execution_progress.assert_called_once()
+    assert executor._progress_flusher is None
+
+
+def test_progress_events_are_coalesced_into_one_batch(monkeypatch):
+    """Progress events emitted in quick succession should be sent as one batch."""
+    monkeypatch.setattr(route_executor_module, "PROGRESS_FLUSH_INTERVAL_S", 60.0)
+    websocket_manager = MagicMock()
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=websocket_manager
+    )
+
+    executor._broadcast_progress({"type": "step_started"})
+    executor._broadcast_progress({"type": "position_moving"})
+    executor._broadcast_progress({"type": "step_completed"})
+    websocket_manager.broadcast_route_execution_progress_batch.assert_not_called()
+    executor._flush_progress()
+
+    websocket_manager.broadcast_route_execution_progress.assert_called_once()
+    websocket_manager.broadcast_route_execution_progress_batch.assert_called_once()
+    assert [event["type"] for event in _sent_progress_events(websocket_manager)] == [
+        "step_started",
+        "position_moving",
+        "step_completed",
+    ]
+
+
+def test_burst_is_flushed_at_end_of_window(monkeypatch):
+    """Queued burst events should go out without an explicit flush."""
+    monkeypatch.setattr(route_executor_module, "PROGRESS_FLUSH_INTERVAL_S", 0.05)
+    websocket_manager = MagicMock()
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=websocket_manager
+    )
+
+    executor._broadcast_progress({"type": "step_started"})
+    executor._broadcast_progress({"type": "position_moving"})
+
+    deadline = time.monotonic() + 2.0
+    while len(_sent_progress_events(websocket_manager)) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [event["type"] for event in _sent_progress_events(websocket_manager)] == [
+        "step_started",
+        "position_moving",
+    ]
+
+
+def test_pending_wait_progress_is_replaced_by_newer_update(monkeypatch):
+    """Only the newest pending wait_progress event per step should be sent."""
+    monkeypatch.setattr(route_executor_module, "PROGRESS_FLUSH_INTERVAL_S", 60.0)
+    websocket_manager = MagicMock()
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=websocket_manager
+    )
+    step = {"id": "wait-1", "type": "wait"}
+
+    executor._broadcast_progress({"type": "step_started", "step": step})
+    executor._broadcast_progress({"type": "wait_progress", "step": step, "elapsed": 500})
+    executor._broadcast_progress({"type": "step_completed", "step": step})
+    executor._broadcast_progress({"type": "wait_progress", "step": step, "elapsed": 1000})
+    executor._flush_progress()
+
+    events = _sent_progress_events(websocket_manager)
+    assert [event["type"] for event in events] == ["step_started", "step_completed", "wait_progress"]
+    assert events[2]["elapsed"] == 1000
+
+
+def test_empty_infinite_loop_returns_promptly_when_stopped():
+    """Stopping a route should interrupt the idle pause of an empty infinite loop."""
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=None
+    )
+    executor.position_check_interval = 10.0
+    executor._executing = True
+
+    threading.Timer(0.05, executor.stop_route).start()
+
+    started = time.monotonic()
+    executor._execute_loop_step({"type": "loop", "iterations": 0, "steps": []})
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+
+
+def test_timed_wait_returns_promptly_when_stopped():
+    """Stopping a route should interrupt a running timed wait step."""
+    executor = RouteExecutor(
+        route_manager=MagicMock(),
+        rotor_logic=MagicMock(),
+        websocket_manager=None
+    )
+    executor._executing = True
+
+    threading.Timer(0.05, executor.stop_route).start()
+
+    started = time.time()
+    executor._wait_with_progress(10000, {"type": "wait", "duration": 10000})
+    elapsed = time.time() - started
+
+    assert elapsed < 1.0
@@ -1,16 +1,9 @@
 """Tests for route persistence behavior."""
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 import server.routes.route_manager as route_manager_module
 from server.routes.route_manager import RouteManager
 
@@ -27,14 +20,162 @@ def test_save_routes_is_atomic_when_write_fails(tmp_path, monkeypatch):
     original_text = routes_file.read_text(encoding="utf-8")
 
     def failing_dump(obj, fp, *args, **kwargs):
-        fp.write('{"routes": [')
+        fp.write(b'{"routes": [')
         fp.flush()
         raise OSError("disk full")
 
-    monkeypatch.setattr(route_manager_module.json, "dump", failing_dump)
+    monkeypatch.setattr(route_manager_module, "dump_json", failing_dump)
 
     with pytest.raises(OSError):
         manager._save_routes()
 
     assert routes_file.read_text(encoding="utf-8") == original_text
     assert not any(path.suffix == ".tmp" for path in tmp_path.iterdir())
+
+
+def test_crud_keeps_id_lookup_in_sync(tmp_path):
+    """Lookups by id should reflect adds, updates and deletes."""
+    manager = RouteManager(routes_file=tmp_path / "routes.json")
+
+    manager.add_route({"id": "a", "name": "A", "steps": []})
+    manager.add_route({"id": "b", "name": "B", "steps": []})
+    with pytest.raises(ValueError, match="already exists"):
+        manager.add_route({"id": "a", "name": "Duplicate", "steps": []})
+
+    manager.update_route("a", {"name": "A2", "steps": []})
+    assert manager.get_route("a")["name"] == "A2"
+    assert [route["id"] for route in manager.get_all_routes()] == ["a", "b"]
+
+    assert manager.delete_route("a") is True
+    assert manager.get_route("a") is None
+    assert manager.delete_route("a") is False
+    assert manager.update_route("a", {"name": "Gone"}) is None
+
+
+def test_batch_edits_are_saved_once(tmp_path, monkeypatch):
+    """Several edits in quick succession should produce a single write."""
+    routes_file = tmp_path / "routes.json"
+    # Keep the debounce timer from firing mid-loop; only flush() writes
+    monkeypatch.setattr(route_manager_module, "SAVE_DEBOUNCE_S", 60.0)
+    manager = RouteManager(routes_file=routes_file)
+    save_calls = []
+    original_save = manager._save_routes
+
+    def counting_save(routes=None):
+        save_calls.append(len(routes))
+        original_save(routes)
+
+    monkeypatch.setattr(manager, "_save_routes", counting_save)
+
+    for index in range(5):
+        manager.add_route({"id": f"r{index}", "name": f"Route {index}", "steps": []}, defer_save=True)
+    manager.flush()
+
+    assert save_calls == [5]
+    saved = json.loads(routes_file.read_text(encoding="utf-8"))
+    assert [route["id"] for route in saved["routes"]] == ["r0", "r1", "r2", "r3", "r4"]
+
+
+def test_failed_background_save_keeps_changes_pending(tmp_path, monkeypatch):
+    """A failed debounced save must leave the changes for the next flush."""
+    routes_file = tmp_path / "routes.json"
+    manager = RouteManager(routes_file=routes_file)
+    monkeypatch.setattr(route_manager_module, "SAVE_RETRY_S", 60.0)
+    original_save = manager._save_routes
+
+    def failing_save(routes=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_save_routes", failing_save)
+    manager.add_route({"id": "a", "name": "A", "steps": []}, defer_save=True)
+    manager._flush_from_timer()
+
+    # The failure re-arms a retry instead of dropping the change
+    assert manager._save_timer is not None
+    assert not routes_file.exists()
+
+    monkeypatch.setattr(manager, "_save_routes", original_save)
+    manager.flush()
+
+    assert manager._save_timer is None
+    saved = json.loads(routes_file.read_text(encoding="utf-8"))
+    assert [route["id"] for route in saved["routes"]] == ["a"]
+
+
+def test_edit_reports_failed_save_to_caller(tmp_path, monkeypatch):
+    """Edits without defer_save are written before returning."""
+    routes_file = tmp_path / "routes.json"
+    manager = RouteManager(routes_file=routes_file)
+
+    manager.add_route({"id": "a", "name": "A", "steps": []})
+    saved = json.loads(routes_file.read_text(encoding="utf-8"))
+    assert [route["id"] for route in saved["routes"]] == ["a"]
+    assert manager._save_timer is None
+
+    def failing_save(routes=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_save_routes", failing_save)
+    with pytest.raises(OSError):
+        manager.delete_route("a")
+
+
+def test_background_save_stops_retrying_after_repeated_failures(tmp_path, monkeypatch):
+    """Persistent write failures are reported instead of retried forever."""
+    manager = RouteManager(routes_file=tmp_path / "routes.json")
+    monkeypatch.setattr(route_manager_module, "SAVE_RETRY_S", 60.0)
+
+    def failing_save(routes=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_save_routes", failing_save)
+    manager.add_route({"id": "a", "name": "A", "steps": []}, defer_save=True)
+    for _ in range(route_manager_module.SAVE_MAX_RETRIES):
+        manager._flush_from_timer()
+
+    assert manager._save_timer is None
+    assert manager._routes_version > manager._saved_version
+
+
+def test_flush_without_changes_does_not_write(tmp_path, monkeypatch):
+    """Loading routes should not count as an unsaved change."""
+    routes_file = tmp_path / "routes.json"
+    routes_file.write_text(json.dumps({"routes": []}), encoding="utf-8")
+    manager = RouteManager(routes_file=routes_file)
+
+    def unexpected_save(routes=None):
+        raise AssertionError("nothing should be written")
+
+    monkeypatch.setattr(manager, "_save_routes", unexpected_save)
+    manager.flush()
+    manager.reload()
+
+
+def test_reload_refuses_to_drop_edit_made_during_flush(tmp_path, monkeypatch):
+    """An edit racing reload() must not be overwritten by the file contents."""
+    manager = RouteManager(routes_file=tmp_path / "routes.json")
+    original_flush = manager.flush
+
+    def flush_then_edit():
+        original_flush()
+        manager.add_route({"id": "late", "name": "Late", "steps": []}, defer_save=True)
+
+    monkeypatch.setattr(manager, "flush", flush_then_edit)
+
+    with pytest.raises(RuntimeError, match="unsaved changes"):
+        manager.reload()
+    assert manager.get_route("late") is not None
+
+
+def test_routes_with_big_ints_and_nan_round_trip(tmp_path):
+    """Values orjson cannot represent must still be saved and loaded."""
+    routes_file = tmp_path / "routes.json"
+    manager = RouteManager(routes_file=routes_file)
+
+    manager.add_route({"id": "a", "name": "A", "steps": [], "big": 2**70 + 1, "offset": float("nan")})
+
+    text = routes_file.read_text(encoding="utf-8")
+    assert f'"big": {2**70 + 1}' in text
+    assert '"offset": NaN' in text
+    reloaded = RouteManager(routes_file=routes_file).get_route("a")
+    assert reloaded["offset"] != reloaded["offset"]
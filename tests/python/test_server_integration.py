@@ -5,48 +5,47 @@ These tests verify the server can be started and accessed correctly.
 
 import json
 import pytest
-import sys
 import threading
-from pathlib import Path
 from urllib.parse import urljoin
 import urllib.request
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from server.core.server import create_test_server
 from server.core.state import ServerState
 
 
+@pytest.fixture(scope="module")
+def server_setup(tmp_path_factory):
+    """Set up one test server shared by the tests in this module."""
+    ServerState.reset_instance()
+    tmp_path = tmp_path_factory.mktemp("integration")
+
+    # Create a simple index.html for static file serving test
+    (tmp_path / "index.html").write_text("<html><body>Test</body></html>")
+
+    server, state, base_url = create_test_server(
+        port=0,
+        config_dir=tmp_path,
+        server_root=tmp_path
+    )
+
+    # Short poll interval so shutdown() returns quickly
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    yield base_url, state, tmp_path
+
+    server.shutdown()
+    thread.join(timeout=0.2)  # shutdown() already waited for the loop
+    server.server_close()
+    state.reset()
+    ServerState.reset_instance()
+
+
 class TestServerIntegration:
     """Integration tests for the server."""
     
-    @pytest.fixture
-    def server_setup(self, tmp_path):
-        """Set up a test server."""
-        ServerState.reset_instance()
-        
-        # Create a simple index.html for static file serving test
-        (tmp_path / "index.html").write_text("<html><body>Test</body></html>")
-        
-        server, state, base_url = create_test_server(
-            port=0,
-            config_dir=tmp_path,
-            server_root=tmp_path
-        )
-        
-        thread = threading.Thread(target=server.serve_forever, daemon=True)
-        thread.start()
-        
-        yield base_url, state, tmp_path
-        
-        server.shutdown()
-        thread.join(timeout=5)
-        server.server_close()
-        state.reset()
-    
     def test_server_starts(self, server_setup):
         """Server should start and be accessible."""
         base_url, state, tmp_path = server_setup
@@ -98,7 +97,7 @@ class TestServerIntegration:
         # Update settings via API
         request = urllib.request.Request(
             urljoin(base_url, "/api/settings"),
-            data=json.dumps({"mapSource": "google"}).encode("utf-8"),
+            data=b'{"mapSource": "google"}',
             headers={"Content-Type": "application/json"},
             method="POST"
         )
@@ -106,12 +105,8 @@ class TestServerIntegration:
         with urllib.request.urlopen(request) as response:
             assert response.status == 200
         
-        # Verify JSON file was created
-        json_file = tmp_path / "web-settings.json"
-        assert json_file.exists()
-        
-        with open(json_file) as f:
-            saved = json.load(f)
+        # Verify JSON file was written (read_bytes raises if it is missing)
+        saved = json.loads((tmp_path / "web-settings.json").read_bytes())
         
         assert saved["mapSource"] == "google"
 
@@ -135,3 +130,34 @@ def test_explicit_initialize_ports_override_persisted_defaults(tmp_path):
         state.reset()
         ServerState.reset_instance()
 
+
+
+def test_concurrent_first_get_instance_returns_one_state(monkeypatch):
+    """Threads racing the first get_instance() call must share one state."""
+    ServerState.reset_instance()
+    original_init = ServerState.__init__
+    release = threading.Event()
+
+    def slow_init(self):
+        # Hold construction open so every thread misses the cache
+        release.wait(1.0)
+        original_init(self)
+
+    monkeypatch.setattr(ServerState, "__init__", slow_init)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(ServerState.get_instance()))
+        for _ in range(4)
+    ]
+
+    try:
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 4
+        assert all(state is results[0] for state in results)
+    finally:
+        ServerState.reset_instance()
@@ -1,16 +1,9 @@
 """Tests for ServerState unexpected disconnect handling and auto reconnect."""
 
-import sys
 import threading
 import time
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from server.core.state import ServerState
 
 
@@ -1,13 +1,5 @@
 """Tests for WebSocket server helpers."""
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from server.api.websocket import WebSocketClient, WebSocketManager
 
 